@@ -5,19 +5,26 @@ This is the entry point for the FastAPI web server that provides
 HTTP API endpoints for the AI agent functionality.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from contextlib import asynccontextmanager
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from contextlib import asynccontextmanager, suppress
+import asyncio
+import orjson
 import uvicorn
-from typing import Dict, Any
+from typing import Optional
 import logging
+import os
 
 from ..config.settings import settings
 from ..config.logging import configure_logging
-from .routes.health import router as health_router
-from .routes.chat import router as chat_router
-from .routes.tools import router as tools_router
+from ..core import model_provider
+from ..services.semantic_cache import semantic_cache
+from ..utils import weather_api_service
+from .routes.health import router as health_router, sample_cpu_percent
+from .routes.chat import router as chat_router, ConversationIdPool
+from .routes.tools import router as tools_router, build_tool_payloads
 
 # Setup logging
 configure_logging()
@@ -29,9 +36,21 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting AI Agent API server...")
     logger.info(f"API Documentation available at: /docs")
+    app.state.available_tools_json, app.state.tool_info_json = build_tool_payloads()
+    cpu_sampler = asyncio.create_task(sample_cpu_percent(app))
+    app.state.conversation_ids = ConversationIdPool()
+    id_refiller = asyncio.create_task(app.state.conversation_ids.run())
     yield
     # Shutdown
     logger.info("Shutting down AI Agent API server...")
+    for task in (cpu_sampler, id_refiller):
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await semantic_cache.close()
+    await model_provider.aclose()
+    await weather_api_service.close()
+    weather_api_service.close_sync()
 
 # Create FastAPI application
 app = FastAPI(
@@ -40,17 +59,24 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",  # Swagger UI
     redoc_url="/redoc",  # ReDoc documentation
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
+# Compress larger JSON bodies such as the tool list and conversation history.
+# Starlette skips text/event-stream responses, so /chat/stream is not buffered.
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
 # CORS Configuration
+# A frozenset makes the per-request origin check a hash lookup; requests
+# without an Origin header (health probes, server-to-server) skip CORS entirely.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
+    allow_origins=frozenset({
         "http://localhost:3000",  # Next.js development server
         "http://127.0.0.1:3000",  # Alternative localhost
         "http://localhost:5173",  # Vite development server
-    ],
+    }),
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
@@ -65,30 +91,53 @@ app.include_router(tools_router, prefix="/api", tags=["Tools"])
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler for unhandled errors"""
-    logger.error(f"Unhandled error: {exc}", exc_info=True)
-    return JSONResponse(
+    # Full tracebacks are costly to format; only capture them when debugging
+    logger.error(f"Unhandled error: {exc!r}", exc_info=logger.isEnabledFor(logging.DEBUG))
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error"}
     )
 
-# Root endpoint
+# Root endpoint (static, so the body is serialized once at import)
+_ROOT_JSON = orjson.dumps({
+    "message": "AI Agent API",
+    "version": "1.0.0",
+    "docs": "/docs",
+    "health": "/api/health"
+})
+
 @app.get("/")
-async def root() -> Dict[str, Any]:
+async def root() -> Response:
     """Root endpoint with API information"""
-    return {
-        "message": "AI Agent API",
-        "version": "1.0.0",
-        "docs": "/docs",
-        "health": "/api/health"
-    }
+    return Response(content=_ROOT_JSON, media_type="application/json")
 
-def run_server(host: str = "0.0.0.0", port: int = 8000, reload: bool = True):
-    """Run the FastAPI server"""
+def run_server(
+    host: str = "0.0.0.0",
+    port: int = 8000,
+    reload: bool = True,
+    workers: Optional[int] = None
+):
+    """
+    Run the FastAPI server.
+    
+    uvicorn's "auto" loop and HTTP implementations pick uvloop and httptools
+    when they are installed (they ship with uvicorn[standard]). Without
+    reload, one worker process is started per CPU unless workers is given;
+    reload only supports a single worker.
+    """
+    if reload:
+        workers = 1
+    elif workers is None:
+        workers = os.cpu_count() or 1
+    
     uvicorn.run(
         "openai_app.api.main:app",
         host=host,
         port=port,
         reload=reload,
+        workers=workers,
+        loop="auto",
+        http="auto",
         log_level="info"
     )
 
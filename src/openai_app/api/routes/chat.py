@@ -4,21 +4,60 @@ Chat API routes.
 Provides endpoints for interacting with the AI agent through chat.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from collections import deque
+from typing import AsyncIterator
+import asyncio
 import uuid
 import time
+import json
 import logging
-from datetime import datetime
 
-from ..schemas.chat import ChatMessage, ChatResponse, ToolUsage
+from ..schemas.chat import ChatMessage, ChatResponse
+from ..schemas import structs
 from ...services.agent_service import agent_service
+from ...services.semantic_cache import semantic_cache
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
-@router.post("/chat/message", response_model=ChatResponse)
-async def send_chat_message(message: ChatMessage) -> ChatResponse:
+class ConversationIdPool:
+    """Pool of pre-generated conversation IDs, refilled in the background."""
+    
+    def __init__(self, size: int = 1024):
+        self.size = size
+        self._ids: deque = deque()
+        self._refill = asyncio.Event()
+    
+    async def run(self):
+        """Top the pool up whenever it drops below half full."""
+        while True:
+            self._ids.extend(str(uuid.uuid4()) for _ in range(self.size - len(self._ids)))
+            self._refill.clear()
+            await self._refill.wait()
+    
+    def next_id(self) -> str:
+        """Take a conversation ID, generating one directly if the pool is empty."""
+        try:
+            conversation_id = self._ids.popleft()
+        except IndexError:
+            conversation_id = str(uuid.uuid4())
+        if len(self._ids) < self.size // 2:
+            self._refill.set()
+        return conversation_id
+
+
+@router.post(
+    "/chat/message",
+    response_model=ChatResponse,
+    openapi_extra=structs.json_body_openapi(ChatMessage)
+)
+async def send_chat_message(
+    request: Request,
+    message: structs.ChatMessage = Depends(structs.json_body(structs.ChatMessage))
+) -> Response:
     """
     Send a message to the AI agent and get a response.
     
@@ -28,14 +67,30 @@ async def send_chat_message(message: ChatMessage) -> ChatResponse:
     Returns:
         ChatResponse with the agent's reply and any tool usage information
     """
+    # Generate conversation ID if not provided
+    conversation_id = message.conversation_id or request.app.state.conversation_ids.next_id()
+    
     try:
-        # Generate conversation ID if not provided
-        conversation_id = message.conversation_id or str(uuid.uuid4())
-        
         logger.info(f"Processing chat message in conversation {conversation_id}")
-        logger.debug(f"Message content: {message.message}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Message content: {message.message}")
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        
+        # Serve near-duplicate messages in this conversation from cache
+        embedding = None
+        if semantic_cache.enabled:
+            cached_response, embedding = await semantic_cache.lookup(
+                conversation_id=conversation_id,
+                message=message.message
+            )
+            if cached_response is not None:
+                logger.info(f"Served cached response in {(time.perf_counter_ns() - start_ns) / 1e9:.2f} seconds")
+                return structs.json_response(structs.ChatResponse(
+                    response=cached_response,
+                    conversation_id=conversation_id,
+                    tool_usage=[]
+                ))
         
         # Process the message through the agent service
         response_data = await agent_service.process_message(
@@ -43,36 +98,111 @@ async def send_chat_message(message: ChatMessage) -> ChatResponse:
             conversation_id=conversation_id
         )
         
-        processing_time = time.time() - start_time
+        processing_time = (time.perf_counter_ns() - start_ns) / 1e9
         logger.info(f"Message processed in {processing_time:.2f} seconds")
         
-        # Convert tool usage data to ToolUsage models
-        tool_usage = []
-        if "tool_usage" in response_data:
-            for tool_data in response_data["tool_usage"]:
-                tool_usage.append(ToolUsage(
-                    tool_name=tool_data.get("tool_name", ""),
-                    parameters=tool_data.get("parameters", {}),
-                    result=tool_data.get("result"),
-                    status=tool_data.get("status", "unknown"),
-                    execution_time=tool_data.get("execution_time")
-                ))
+        if semantic_cache.enabled:
+            await semantic_cache.store(
+                conversation_id=conversation_id,
+                message=message.message,
+                response=response_data["content"],
+                embedding=embedding
+            )
+        
+        # Convert tool call records to ToolUsage structs (no validation; the data is internal)
+        tool_usage = [
+            structs.ToolUsage(
+                tool_name=record.tool_name,
+                parameters=record.parameters,
+                result=record.result,
+                status=record.status,
+                execution_time=record.execution_time
+            )
+            for record in response_data["tool_usage"]
+        ]
         
-        return ChatResponse(
+        return structs.json_response(structs.ChatResponse(
             response=response_data["content"],
             conversation_id=conversation_id,
-            tool_usage=tool_usage,
-            timestamp=datetime.now()
-        )
+            tool_usage=tool_usage
+        ))
         
     except Exception as e:
-        logger.error(f"Error processing chat message: {e}", exc_info=True)
+        logger.error(
+            f"Error processing chat message in conversation {conversation_id}: {e!r}",
+            exc_info=logger.isEnabledFor(logging.DEBUG)
+        )
         raise HTTPException(
             status_code=500, 
             detail=f"Failed to process message: {str(e)}"
         )
 
 
+@router.post("/chat/stream", openapi_extra=structs.json_body_openapi(ChatMessage))
+async def stream_chat_message(
+    request: Request,
+    message: structs.ChatMessage = Depends(structs.json_body(structs.ChatMessage))
+) -> StreamingResponse:
+    """
+    Send a message to the AI agent and stream the reply as server-sent events.
+    
+    Each event carries a "delta" with the next chunk of text. The final
+    event is {"done": true, "conversation_id": ...}.
+    
+    Args:
+        message: ChatMessage containing the user's message and optional conversation ID
+        
+    Returns:
+        StreamingResponse emitting text/event-stream events
+    """
+    conversation_id = message.conversation_id or request.app.state.conversation_ids.next_id()
+    logger.info(f"Streaming chat message in conversation {conversation_id}")
+    
+    async def event_stream() -> AsyncIterator[str]:
+        embedding = None
+        if semantic_cache.enabled:
+            cached_response, embedding = await semantic_cache.lookup(
+                conversation_id=conversation_id,
+                message=message.message
+            )
+            if cached_response is not None:
+                yield f"data: {json.dumps({'delta': cached_response})}\n\n"
+                yield f"data: {json.dumps({'done': True, 'conversation_id': conversation_id})}\n\n"
+                return
+        
+        chunks = []
+        try:
+            async for delta in agent_service.stream_message(
+                message=message.message,
+                conversation_id=conversation_id
+            ):
+                chunks.append(delta)
+                yield f"data: {json.dumps({'delta': delta})}\n\n"
+        except Exception as e:
+            logger.error(
+                f"Error streaming chat message in conversation {conversation_id}: {e!r}",
+                exc_info=logger.isEnabledFor(logging.DEBUG)
+            )
+            yield f"data: {json.dumps({'error': 'Failed to process message'})}\n\n"
+            return
+        
+        if semantic_cache.enabled:
+            await semantic_cache.store(
+                conversation_id=conversation_id,
+                message=message.message,
+                response="".join(chunks),
+                embedding=embedding
+            )
+        
+        yield f"data: {json.dumps({'done': True, 'conversation_id': conversation_id})}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/chat/history/{conversation_id}")
 async def get_conversation_history(conversation_id: str):
     """
@@ -105,6 +235,7 @@ async def clear_conversation_history(conversation_id: str):
         Confirmation of deletion
     """
     # This is a placeholder - you would implement conversation storage
+    semantic_cache.clear(conversation_id)
     return {
         "conversation_id": conversation_id,
         "message": "Conversation cleared",
@@ -5,39 +5,104 @@ Provides endpoints for monitoring the health and status
 of the AI agent API service.
 """
 
-from fastapi import APIRouter
-from typing import Dict, Any
+from fastapi import APIRouter, FastAPI, Request, Response
+from functools import lru_cache
+from typing import Dict, Any, Tuple
+import asyncio
+import orjson
 import psutil
-import os
+import sys
+import time
 from datetime import datetime
 
-from ...config.settings import settings
+from ...config.settings import settings_fast
 
 router = APIRouter()
 
+# Fixed for the process lifetime
+_PYVER = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+_LOG_LEVEL = settings_fast.log_level
+
+
+async def sample_cpu_percent(app: FastAPI, interval: float = 1.0):
+    """
+    Keep app.state.cpu_percent up to date in the background.
+    
+    psutil.cpu_percent(interval) blocks for the whole interval, so it runs
+    in a worker thread and the health endpoint only reads the last sample.
+    
+    Args:
+        app: Application whose state receives the samples
+        interval: Sampling window in seconds
+    """
+    # Prime psutil's counters so the first read has a baseline
+    app.state.cpu_percent = psutil.cpu_percent(interval=None)
+    while True:
+        app.state.cpu_percent = await asyncio.to_thread(psutil.cpu_percent, interval)
+
+
+def memory_info() -> Tuple[int, int, float]:
+    """
+    Get system memory usage, refreshed at most once per second.
+    
+    Returns:
+        Tuple of (total bytes, available bytes, percent used)
+    """
+    return _read_memory_info(int(time.monotonic()))
+
+
+@lru_cache(maxsize=1)
+def _read_memory_info(second: int) -> Tuple[int, int, float]:
+    # Read /proc/meminfo directly on Linux; fall back to psutil elsewhere
+    try:
+        fields = {}
+        with open("/proc/meminfo", "rb") as meminfo:
+            for line in meminfo:
+                key, _, value = line.partition(b":")
+                if key in (b"MemTotal", b"MemAvailable"):
+                    fields[key] = int(value.split()[0]) * 1024
+                    if len(fields) == 2:
+                        break
+        total = fields[b"MemTotal"]
+        available = fields[b"MemAvailable"]
+    except (OSError, KeyError, ValueError):
+        memory = psutil.virtual_memory()
+        return memory.total, memory.available, memory.percent
+    
+    return total, available, round((total - available) / total * 100, 1)
+
+
+# Everything in the basic health body except the timestamp is fixed for the
+# process lifetime, so serialize it once and splice the timestamp in per call.
+_HEALTH_PREFIX, _, _HEALTH_SUFFIX = orjson.dumps({
+    "status": "healthy",
+    "message": "AI Agent API is running",
+    "version": "1.0.0",
+    "timestamp": "__timestamp__",
+    "environment": {
+        "python_version": _PYVER,
+        "log_level": _LOG_LEVEL,
+    }
+}).partition(b"__timestamp__")
+
 
 @router.get("/health")
-async def health_check() -> Dict[str, Any]:
+async def health_check() -> Response:
     """
     Health check endpoint to verify the API is running properly.
     
     Returns:
-        Dict containing health status, version, and system information
+        JSON containing health status, version, and system information
     """
-    return {
-        "status": "healthy",
-        "message": "AI Agent API is running",
-        "version": "1.0.0",
-        "timestamp": datetime.now().isoformat(),
-        "environment": {
-            "python_version": f"{os.sys.version_info.major}.{os.sys.version_info.minor}.{os.sys.version_info.micro}",
-            "log_level": settings.log_level,
-        }
-    }
+    timestamp = datetime.now().isoformat().encode()
+    return Response(
+        content=b"".join((_HEALTH_PREFIX, timestamp, _HEALTH_SUFFIX)),
+        media_type="application/json"
+    )
 
 
 @router.get("/health/detailed")
-async def detailed_health_check() -> Dict[str, Any]:
+async def detailed_health_check(request: Request) -> Dict[str, Any]:
     """
     Detailed health check with system metrics.
     
@@ -45,8 +110,8 @@ async def detailed_health_check() -> Dict[str, Any]:
         Dict containing detailed system health information
     """
     # Get system information
-    memory = psutil.virtual_memory()
-    cpu_percent = psutil.cpu_percent(interval=1)
+    total_memory, available_memory, memory_percent = memory_info()
+    cpu_percent = request.app.state.cpu_percent
     
     return {
         "status": "healthy",
@@ -56,16 +121,16 @@ async def detailed_health_check() -> Dict[str, Any]:
         "system": {
             "cpu_usage_percent": cpu_percent,
             "memory": {
-                "total_mb": round(memory.total / 1024 / 1024, 2),
-                "available_mb": round(memory.available / 1024 / 1024, 2),
-                "used_percent": memory.percent
+                "total_mb": round(total_memory / 1024 / 1024, 2),
+                "available_mb": round(available_memory / 1024 / 1024, 2),
+                "used_percent": memory_percent
             },
-            "python_version": f"{os.sys.version_info.major}.{os.sys.version_info.minor}.{os.sys.version_info.micro}",
+            "python_version": _PYVER,
         },
         "configuration": {
-            "log_level": settings.log_level,
-            "gemini_api_configured": bool(settings.gemini_api_key),
-            "weather_api_configured": bool(settings.weather_api_key),
-            "tavily_api_configured": bool(settings.tavily_api_key),
+            "log_level": _LOG_LEVEL,
+            "gemini_api_configured": bool(settings_fast.gemini_api_key),
+            "weather_api_configured": bool(settings_fast.weather_api_key),
+            "tavily_api_configured": bool(settings_fast.tavily_api_key),
         }
     }
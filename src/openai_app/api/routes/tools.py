@@ -4,10 +4,12 @@ Tools API routes.
 Provides endpoints for managing and executing AI agent tools.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+import math
 import time
 import logging
-from typing import Dict, Any
+import orjson
+from typing import Dict, Tuple
 
 from ..schemas.tools import (
     AvailableToolsResponse, 
@@ -15,44 +17,69 @@ from ..schemas.tools import (
     ToolExecutionRequest, 
     ToolExecutionResponse
 )
-from ...tools.registry import tool_registry
+from ..schemas import structs
+from ...tools.registry import (
+    tool_registry,
+    ToolNotFound,
+    ToolValidationError,
+    ToolRuntimeError
+)
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+def build_tool_payloads() -> Tuple[bytes, Dict[str, bytes]]:
+    """
+    Serialize tool information once for the read-only tool endpoints.
+    
+    The tool registry only changes at startup, so the JSON bodies can be
+    built once and served as-is.
+    
+    Returns:
+        Tuple of (AvailableToolsResponse JSON, dict of tool name to ToolInfo JSON)
+    """
+    tool_infos = [
+        ToolInfo(
+            name=tool.name,
+            description=tool.description,
+            parameters=tool.parameters
+        )
+        for tool in tool_registry.get_all_tools()
+    ]
+    
+    available_tools = AvailableToolsResponse(
+        tools=tool_infos,
+        total_count=len(tool_infos)
+    )
+    
+    available_tools_json = orjson.dumps(available_tools.model_dump())
+    tool_info_json = {info.name: orjson.dumps(info.model_dump()) for info in tool_infos}
+    return available_tools_json, tool_info_json
+
+
 @router.get("/tools/available", response_model=AvailableToolsResponse)
-async def get_available_tools() -> AvailableToolsResponse:
+async def get_available_tools(request: Request) -> Response:
     """
     Get list of all available tools.
     
     Returns:
         AvailableToolsResponse containing all registered tools and their information
     """
-    try:
-        tools = tool_registry.get_all_tools()
-        
-        tool_infos = []
-        for tool in tools:
-            tool_info = ToolInfo(
-                name=tool.name,
-                description=tool.description,
-                parameters=tool.parameters
-            )
-            tool_infos.append(tool_info)
-        
-        return AvailableToolsResponse(
-            tools=tool_infos,
-            total_count=len(tool_infos)
-        )
-        
-    except Exception as e:
-        logger.error(f"Error getting available tools: {e}")
-        raise HTTPException(status_code=500, detail="Failed to retrieve available tools")
+    return Response(
+        content=request.app.state.available_tools_json,
+        media_type="application/json"
+    )
 
 
-@router.post("/tools/execute", response_model=ToolExecutionResponse)
-async def execute_tool(request: ToolExecutionRequest) -> ToolExecutionResponse:
+@router.post(
+    "/tools/execute",
+    response_model=ToolExecutionResponse,
+    openapi_extra=structs.json_body_openapi(ToolExecutionRequest)
+)
+async def execute_tool(
+    request: structs.ToolExecutionRequest = Depends(structs.json_body(structs.ToolExecutionRequest))
+) -> Response:
     """
     Execute a specific tool with given parameters.
     
@@ -62,54 +89,46 @@ async def execute_tool(request: ToolExecutionRequest) -> ToolExecutionResponse:
     Returns:
         ToolExecutionResponse with execution result
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
-    try:
-        # Get the tool from registry
-        tool = tool_registry.get_tool(request.tool_name)
-        if not tool:
-            raise HTTPException(
-                status_code=404, 
-                detail=f"Tool '{request.tool_name}' not found"
-            )
-        
+    if logger.isEnabledFor(logging.INFO):
         logger.info(f"Executing tool: {request.tool_name} with parameters: {request.parameters}")
-        
-        # Execute the tool
-        result = await tool.execute(**request.parameters)
-        
-        execution_time = time.time() - start_time
-        
-        return ToolExecutionResponse(
-            tool_name=request.tool_name,
-            parameters=request.parameters,
-            result=result,
-            status="success",
-            execution_time=round(execution_time, 3),
-            error_message=None
+    
+    try:
+        result = await tool_registry.execute_tool(request.tool_name, request.parameters)
+    except ToolNotFound:
+        raise HTTPException(
+            status_code=404, 
+            detail=f"Tool '{request.tool_name}' not found"
         )
+    except (ToolValidationError, ToolRuntimeError) as e:
+        execution_time = (time.perf_counter_ns() - start_ns) / 1e9
         
-    except HTTPException:
-        # Re-raise HTTP exceptions
-        raise
-    except Exception as e:
-        execution_time = time.time() - start_time
-        error_message = str(e)
-        
-        logger.error(f"Tool execution failed: {error_message}")
+        logger.error(f"Tool execution failed: {request.tool_name} ({e.code})")
         
-        return ToolExecutionResponse(
+        return structs.json_response(structs.ToolExecutionResponse(
             tool_name=request.tool_name,
             parameters=request.parameters,
             result="",
             status="error",
-            execution_time=round(execution_time, 3),
-            error_message=error_message
-        )
+            execution_time=math.floor(execution_time * 1000) / 1000,
+            error_message=e.code
+        ))
+    
+    execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+    
+    return structs.json_response(structs.ToolExecutionResponse(
+        tool_name=request.tool_name,
+        parameters=request.parameters,
+        result=result,
+        status="success",
+        execution_time=math.floor(execution_time * 1000) / 1000,
+        error_message=None
+    ))
 
 
-@router.get("/tools/{tool_name}")
-async def get_tool_info(tool_name: str) -> ToolInfo:
+@router.get("/tools/{tool_name}", response_model=ToolInfo)
+async def get_tool_info(tool_name: str, request: Request) -> Response:
     """
     Get detailed information about a specific tool.
     
@@ -119,22 +138,11 @@ async def get_tool_info(tool_name: str) -> ToolInfo:
     Returns:
         ToolInfo containing tool details
     """
-    try:
-        tool = tool_registry.get_tool(tool_name)
-        if not tool:
-            raise HTTPException(
-                status_code=404, 
-                detail=f"Tool '{tool_name}' not found"
-            )
-        
-        return ToolInfo(
-            name=tool.name,
-            description=tool.description,
-            parameters=tool.parameters
+    tool_info_json = request.app.state.tool_info_json.get(tool_name)
+    if tool_info_json is None:
+        raise HTTPException(
+            status_code=404, 
+            detail=f"Tool '{tool_name}' not found"
         )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting tool info: {e}")
-        raise HTTPException(status_code=500, detail="Failed to retrieve tool information")
+    
+    return Response(content=tool_info_json, media_type="application/json")
@@ -7,7 +7,7 @@ for chat interactions with the AI agent.
 
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 
 
 class ChatMessage(BaseModel):
@@ -49,7 +49,7 @@ class ChatResponse(BaseModel):
     response: str = Field(..., description="The AI agent's response")
     conversation_id: str = Field(..., description="Unique identifier for this conversation")
     tool_usage: List[ToolUsage] = Field(default=[], description="List of tools used to generate this response")
-    timestamp: datetime = Field(default_factory=datetime.now, description="When this response was generated")
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="When this response was generated")
     
     class Config:
         json_schema_extra = {
@@ -65,7 +65,7 @@ class ChatResponse(BaseModel):
                         "execution_time": 1.23
                     }
                 ],
-                "timestamp": "2025-07-15T10:30:00"
+                "timestamp": "2025-07-15T10:30:00Z"
             }
         }
 
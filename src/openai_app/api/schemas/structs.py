@@ -0,0 +1,99 @@
+"""
+msgspec structs for the chat and tool execution endpoints.
+
+These mirror the pydantic models in chat.py and tools.py, which remain
+the source of the OpenAPI documentation. Request bodies are decoded and
+responses encoded with msgspec, which validates and serializes far
+faster than pydantic on these hot paths.
+"""
+
+from datetime import datetime, timezone
+from typing import Annotated, Any, Callable, Dict, List, Optional, Type, TypeVar
+
+import msgspec
+from fastapi import HTTPException, Request, Response
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class ChatMessage(msgspec.Struct, kw_only=True):
+    """Request body for sending a message to the AI agent"""
+    message: Annotated[str, msgspec.Meta(min_length=1, max_length=5000)]
+    conversation_id: Optional[str] = None
+
+
+class ToolUsage(msgspec.Struct, kw_only=True):
+    """A tool that was used during processing"""
+    tool_name: str
+    parameters: Dict[str, Any]
+    result: Optional[str] = None
+    status: str
+    execution_time: Optional[float] = None
+
+
+class ChatResponse(msgspec.Struct, kw_only=True):
+    """Response body for chat messages"""
+    response: str
+    conversation_id: str
+    tool_usage: List[ToolUsage] = []
+    timestamp: datetime = msgspec.field(default_factory=_utcnow)
+
+
+class ToolExecutionRequest(msgspec.Struct, kw_only=True):
+    """Request body for executing a specific tool"""
+    tool_name: str
+    parameters: Dict[str, Any]
+
+
+class ToolExecutionResponse(msgspec.Struct, kw_only=True):
+    """Response body for tool execution"""
+    tool_name: str
+    parameters: Dict[str, Any]
+    result: str
+    status: str
+    execution_time: float
+    error_message: Optional[str] = None
+
+
+def json_body(struct_type: Type[T]) -> Callable:
+    """
+    Build a FastAPI dependency that decodes the request body into a struct.
+
+    Args:
+        struct_type: The msgspec struct to decode into
+
+    Returns:
+        Dependency callable returning the decoded struct
+    """
+    decoder = msgspec.json.Decoder(struct_type)
+
+    async def decode(request: Request) -> T:
+        try:
+            return decoder.decode(await request.body())
+        except (msgspec.ValidationError, msgspec.DecodeError) as e:
+            raise HTTPException(status_code=422, detail=str(e))
+
+    return decode
+
+
+def json_body_openapi(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Document a msgspec-decoded request body using its pydantic twin."""
+    return {
+        "requestBody": {
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+            "required": True,
+        }
+    }
+
+
+_encoder = msgspec.json.Encoder()
+
+
+def json_response(obj: Any) -> Response:
+    """Encode a struct into a JSON response."""
+    return Response(content=_encoder.encode(obj), media_type="application/json")
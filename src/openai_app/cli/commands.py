@@ -22,8 +22,31 @@ def cli():
               type=click.Choice(['auto', 'weather', 'general']), 
               default='auto',
               help='Type of query to run')
-def ask(query, query_type):
+@click.option('--batch', 'batch_file',
+              type=click.File('r'),
+              help='Run each non-empty line of a file as a separate query, concurrently')
+def ask(query, query_type, batch_file):
     """Ask a question to the AI assistant."""
+    if batch_file is not None:
+        queries = [line.strip() for line in batch_file if line.strip()]
+        if not queries:
+            click.echo("❌ No questions found in batch file!")
+            return
+        
+        async def run_batch():
+            try:
+                responses = await app_service.run_queries(queries, query_type)
+                for question, response in zip(queries, responses):
+                    if isinstance(response, Exception):
+                        click.echo(f"\n💬 {question}\n❌ Error: {str(response)}")
+                    else:
+                        click.echo(f"\n💬 {question}\n🤖 {response}")
+            except Exception as e:
+                click.echo(f"❌ Error: {str(e)}")
+        
+        asyncio.run(run_batch())
+        return
+    
     if not query:
         click.echo("❌ Please provide a question!")
         return
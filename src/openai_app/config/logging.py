@@ -2,6 +2,7 @@
 Logging configuration for the application.
 Uses structlog for structured logging.
 """
+import functools
 import logging
 import sys
 from typing import Any, Dict
@@ -50,3 +51,27 @@ def configure_logging() -> None:
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     """Get a configured logger instance."""
     return structlog.get_logger(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _stdlib_logger(name: str) -> logging.Logger:
+    # Stdlib loggers live for the whole process, so the lookup can be cached
+    return logging.getLogger(name)
+
+
+def info_enabled(name: str) -> bool:
+    """
+    Check whether INFO records from a logger would be emitted.
+    
+    structlog filters records through the stdlib logger of the same name
+    (filter_by_level), so its effective level decides what is emitted,
+    including the ERROR level quiet mode sets on "openai_app". Hot paths
+    check this before an info call to skip building its fields.
+    
+    Args:
+        name: Logger name, usually the calling module's __name__
+        
+    Returns:
+        True if INFO records would be emitted
+    """
+    return _stdlib_logger(name).isEnabledFor(logging.INFO)
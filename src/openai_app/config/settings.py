@@ -2,6 +2,7 @@
 Application settings and configuration management.
 Uses Pydantic to load and validate environment variables.
 """
+from types import SimpleNamespace
 from pydantic import Field
 from pydantic_settings import BaseSettings
 from typing import Optional
@@ -25,14 +26,24 @@ class Settings(BaseSettings):
         default="https://api.openweathermap.org/data/2.5",
         description="Weather API base URL"
     )
+    weather_cache_ttl: int = Field(default=600, description="Seconds a weather response is cached per city (0 disables)")
 
     # Search API Configuration (add this after weather config)
     tavily_api_key: Optional[str] = Field(None, description="Tavily Search API key")
     tavily_max_results: int = Field(default=5, description="Maximum number of search results")
     tavily_include_answer: bool = Field(default=True, description="Include AI-generated answer")
     tavily_include_raw_content: bool = Field(default=False, description="Include raw content")
-    
+    search_cache_ttl: int = Field(default=900, description="Seconds search results are cached per query (0 disables)")
+
+    # Semantic Cache Configuration
+    semantic_cache_enabled: bool = Field(default=False, description="Serve near-duplicate chat messages from cache")
+    semantic_cache_threshold: float = Field(default=0.1, description="Maximum cosine distance for a cache hit")
+    semantic_cache_ttl: int = Field(default=1800, description="Seconds a cached response stays valid")
+    embedding_model: str = Field(default="text-embedding-004", description="Embedding model used by the semantic cache")
+
     # Application Settings
+    max_concurrent_queries: int = Field(default=4, description="Maximum queries run at once in batch mode")
+    history_max: int = Field(default=1000, description="Maximum conversation history entries kept in memory")
     log_level: str = Field(default="INFO", description="Logging level")
     debug: bool = Field(default=False, description="Debug mode")
     environment: str = Field(default="development", description="Application environment")
@@ -48,3 +59,7 @@ class Settings(BaseSettings):
 
 # Create global settings instance
 settings = Settings()
+
+# Plain-attribute snapshot of the settings for hot paths; values are
+# loaded once at startup and never change afterwards
+settings_fast = SimpleNamespace(**settings.model_dump())
@@ -2,7 +2,10 @@
 Agent factory and configuration.
 Creates and manages AI agents with different configurations.
 """
-from typing import List, Optional
+import textwrap
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from agents import Agent
 
 from .models import model_provider
@@ -12,12 +15,61 @@ from .exceptions import AgentError
 
 logger = get_logger(__name__)
 
+# Model getter for each supported model_type
+_MODEL_GETTERS: Dict[str, Callable] = {
+    "gemini": model_provider.get_gemini_model,
+    "openai": model_provider.get_openai_model,
+}
+
+_WEATHER_INSTRUCTIONS = textwrap.dedent("""
+    You are a helpful weather assistant. Your primary function is to provide weather information for cities.
+    
+    When users ask about weather:
+    1. Use the get_weather tool to fetch weather information; when several cities are
+       asked about, use get_weather_batch once with all of them instead
+    2. Provide clear, conversational responses
+    3. If asked about weather conditions, be specific about temperature and conditions
+    
+    Always be friendly and helpful in your responses.
+""").strip()
+
+_DEFAULT_GENERAL_INSTRUCTIONS = textwrap.dedent("""
+    You are a helpful AI assistant. You can help with various tasks and answer questions.
+    You have access to various tools to help provide accurate information.
+    When you need weather for several cities or several independent web searches,
+    call get_weather_batch or search_web_batch once rather than the single tools repeatedly.
+    Always be helpful, accurate, and friendly in your responses.
+""").strip()
+
+
+def _get_model(model_type: str) -> Any:
+    """Get the model for a model type, raising ValueError for unknown types."""
+    try:
+        getter = _MODEL_GETTERS[model_type]
+    except KeyError:
+        raise ValueError(f"Unknown model type: {model_type}") from None
+    return getter()
+
 
 class AgentFactory:
     """Factory for creating and configuring agents."""
     
-    def __init__(self):
-        self._agents = {}
+    def __init__(self) -> None:
+        self._agents: Dict[str, Agent] = {}
+        self._lock = threading.Lock()
+        self._agent_locks: Dict[str, threading.Lock] = {}
+        self._tools_cache: Optional[tuple] = None
+        self._custom_cache: "OrderedDict[Tuple[str, Optional[str], str], Agent]" = OrderedDict()
+        self._custom_cache_size = 128
+        
+        # Agents hold their model, so they must be rebuilt once the model clients are closed
+        model_provider.add_close_callback(self.clear_agents)
+    
+    def _get_tools(self) -> tuple:
+        """Get the registry's function tools, built once and reused by every agent."""
+        if self._tools_cache is None:
+            self._tools_cache = tuple(tool_registry.get_function_tools())
+        return self._tools_cache
     
     def create_weather_agent(
         self,
@@ -34,56 +86,31 @@ class AgentFactory:
         Returns:
             Configured Agent instance
         """
-        logger.info("Creating weather agent", name=name, model_type=model_type)
-        
         try:
             # Get the appropriate model
-            if model_type == "gemini":
-                logger.info("Getting Gemini model")
-                model = model_provider.get_gemini_model()
-                logger.info("Gemini model obtained successfully")
-            elif model_type == "openai":
-                model = model_provider.get_openai_model()
-            else:
-                raise ValueError(f"Unknown model type: {model_type}")
+            model = _get_model(model_type)
             
             # Get weather tools
-            logger.info("Getting tools from registry")
-            tools = tool_registry.get_function_tools()
-            logger.info("Tools obtained", tool_count=len(tools))
+            tools = self._get_tools()
             
             # Create agent with weather-specific instructions
-            instructions = """
-            You are a helpful weather assistant. Your primary function is to provide weather information for cities.
-            
-            When users ask about weather:
-            1. Use the get_weather tool to fetch weather information
-            2. Provide clear, conversational responses
-            3. If asked about weather conditions, be specific about temperature and conditions
-            
-            Always be friendly and helpful in your responses.
-            """
-            
-            logger.info("Creating Agent instance")
             agent = Agent(
                 name=name,
-                instructions=instructions.strip(),
+                instructions=_WEATHER_INSTRUCTIONS,
                 model=model,
-                tools=tools
+                tools=list(tools)
             )
-            logger.info("Agent instance created successfully")
             
             # Store agent for reuse
-            self._agents[name] = agent
-            logger.info("Weather agent created successfully", name=name, tools_count=len(tools))
+            with self._lock:
+                self._agents[name] = agent
+            logger.info("Weather agent created successfully", name=name, model_type=model_type, tools_count=len(tools))
             
             return agent
             
         except Exception as e:
             logger.error("Error creating weather agent", error=str(e), name=name)
             raise AgentError(f"Failed to create weather agent: {str(e)}")
-        
-        return agent
     
     def create_general_agent(
         self,
@@ -102,52 +129,111 @@ class AgentFactory:
         Returns:
             Configured Agent instance
         """
-        logger.info("Creating general agent", name=name, model_type=model_type)
-        
         # Get the appropriate model
-        if model_type == "gemini":
-            model = model_provider.get_gemini_model()
-        elif model_type == "openai":
-            model = model_provider.get_openai_model()
-        else:
-            raise ValueError(f"Unknown model type: {model_type}")
+        model = _get_model(model_type)
         
         # Default instructions if none provided
         if instructions is None:
-            instructions = """
-            You are a helpful AI assistant. You can help with various tasks and answer questions.
-            You have access to various tools to help provide accurate information.
-            Always be helpful, accurate, and friendly in your responses.
-            """
+            instructions = _DEFAULT_GENERAL_INSTRUCTIONS
+        else:
+            instructions = instructions.strip()
         
         # Get all available tools
-        tools = tool_registry.get_function_tools()
+        tools = self._get_tools()
         
         agent = Agent(
             name=name,
-            instructions=instructions.strip(),
+            instructions=instructions,
             model=model,
-            tools=tools
+            tools=list(tools)
         )
         
         # Store agent for reuse
-        self._agents[name] = agent
-        logger.info("General agent created successfully", name=name, tools_count=len(tools))
+        with self._lock:
+            self._agents[name] = agent
+        logger.info("General agent created successfully", name=name, model_type=model_type, tools_count=len(tools))
         
         return agent
     
+    def get_or_create_general_agent(
+        self,
+        name: str,
+        instructions: Optional[str] = None,
+        model_type: str = "gemini"
+    ) -> Agent:
+        """
+        Get a general agent built with the same settings, or create it.
+        
+        Agents are cached by (name, instructions, model_type), so repeated
+        custom queries reuse one Agent instead of rebuilding it each time.
+        
+        Args:
+            name: Agent name
+            instructions: Custom instructions (optional)
+            model_type: Type of model to use
+            
+        Returns:
+            Configured Agent instance
+        """
+        key = (name, instructions, model_type)
+        agent = self._custom_cache.get(key)
+        if agent is None:
+            with self._lock_for(name):
+                agent = self._custom_cache.get(key)
+                if agent is None:
+                    agent = self.create_general_agent(name, instructions, model_type)
+                    with self._lock:
+                        self._custom_cache[key] = agent
+                        if len(self._custom_cache) > self._custom_cache_size:
+                            self._custom_cache.popitem(last=False)
+        return agent
+    
     def get_agent(self, name: str) -> Optional[Agent]:
         """Get a previously created agent by name."""
         return self._agents.get(name)
     
+    def get_or_create(self, name: str, create: Callable[[], Agent]) -> Agent:
+        """
+        Get an agent by name, creating it once if it does not exist yet.
+        
+        Concurrent callers asking for the same missing agent wait on a
+        per-name lock, so only one of them builds it.
+        
+        Args:
+            name: Agent name
+            create: Callable that creates and stores the agent
+            
+        Returns:
+            The existing or newly created Agent instance
+        """
+        agent = self._agents.get(name)
+        if agent is None:
+            with self._lock_for(name):
+                agent = self._agents.get(name)
+                if agent is None:
+                    agent = create()
+        return agent
+    
+    def _lock_for(self, name: str) -> threading.Lock:
+        with self._lock:
+            return self._agent_locks.setdefault(name, threading.Lock())
+    
     def list_agents(self) -> List[str]:
         """List all created agent names."""
-        return list(self._agents.keys())
+        with self._lock:
+            return list(self._agents.keys())
     
-    def clear_agents(self):
+    def clear_agents(self) -> None:
         """Clear all stored agents."""
-        self._agents.clear()
+        with self._lock:
+            self._agents.clear()
+            self._agent_locks.clear()
+            self._custom_cache.clear()
         logger.info("All agents cleared")
+    
+    def clear_tools_cache(self) -> None:
+        """Drop the cached tool list so the next agent picks up registry changes."""
+        self._tools_cache = None
 
 
 # Create global agent factory instance
@@ -2,7 +2,9 @@
 Model provider and configuration.
 Manages different AI models (Gemini, OpenAI, etc.).
 """
-from typing import Optional
+import threading
+from typing import Callable, List, Optional
+import httpx
 from openai import AsyncOpenAI
 from agents import OpenAIChatCompletionsModel
 
@@ -11,35 +13,88 @@ from ..config.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Connection pool shared by every model client, so agent runs reuse warm
+# keep-alive connections instead of paying a TLS handshake per request
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30)
+_HTTP_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
 
 class ModelProvider:
     """Provider for managing AI models."""
     
     def __init__(self):
+        # Reentrant because the model getters create their client under the lock
+        self._init_lock = threading.RLock()
+        self._http_client: Optional[httpx.AsyncClient] = None
         self._gemini_client: Optional[AsyncOpenAI] = None
         self._gemini_model: Optional[OpenAIChatCompletionsModel] = None
         self._openai_client: Optional[AsyncOpenAI] = None
         self._openai_model: Optional[OpenAIChatCompletionsModel] = None
+        self._close_callbacks: List[Callable[[], None]] = []
+    
+    def get_http_client(self) -> httpx.AsyncClient:
+        """Get or create the HTTP client shared by all model clients."""
+        if self._http_client is None:
+            with self._init_lock:
+                if self._http_client is None:
+                    self._http_client = httpx.AsyncClient(
+                        http2=True,
+                        limits=_HTTP_LIMITS,
+                        timeout=_HTTP_TIMEOUT
+                    )
+        return self._http_client
+    
+    def add_close_callback(self, callback: Callable[[], None]):
+        """Register a callback to run after aclose, e.g. to drop objects built on the old clients."""
+        self._close_callbacks.append(callback)
+    
+    async def aclose(self):
+        """
+        Close the shared HTTP client.
+        
+        The clients and models built on it are dropped as well, so the next
+        getter call lazily creates fresh ones on a new connection pool.
+        """
+        with self._init_lock:
+            http_client = self._http_client
+            self._http_client = None
+            self._gemini_client = None
+            self._gemini_model = None
+            self._openai_client = None
+            self._openai_model = None
+        
+        if http_client is None:
+            # Nothing was built on a client, so there is nothing to drop
+            return
+        
+        await http_client.aclose()
+        for callback in self._close_callbacks:
+            callback()
     
     def get_gemini_client(self) -> AsyncOpenAI:
         """Get or create Gemini client."""
         if self._gemini_client is None:
-            logger.info("Creating Gemini client", base_url=settings.gemini_base_url)
-            self._gemini_client = AsyncOpenAI(
-                api_key=settings.gemini_api_key,
-                base_url=settings.gemini_base_url
-            )
+            with self._init_lock:
+                if self._gemini_client is None:
+                    logger.info("Creating Gemini client", base_url=settings.gemini_base_url)
+                    self._gemini_client = AsyncOpenAI(
+                        api_key=settings.gemini_api_key,
+                        base_url=settings.gemini_base_url,
+                        http_client=self.get_http_client()
+                    )
         return self._gemini_client
     
     def get_gemini_model(self) -> OpenAIChatCompletionsModel:
         """Get or create Gemini model."""
         if self._gemini_model is None:
-            logger.info("Creating Gemini model", model=settings.gemini_model)
-            client = self.get_gemini_client()
-            self._gemini_model = OpenAIChatCompletionsModel(
-                model=settings.gemini_model,
-                openai_client=client
-            )
+            with self._init_lock:
+                if self._gemini_model is None:
+                    logger.info("Creating Gemini model", model=settings.gemini_model)
+                    client = self.get_gemini_client()
+                    self._gemini_model = OpenAIChatCompletionsModel(
+                        model=settings.gemini_model,
+                        openai_client=client
+                    )
         return self._gemini_model
     
     def get_openai_client(self) -> AsyncOpenAI:
@@ -48,19 +103,26 @@ class ModelProvider:
             raise ValueError("OpenAI API key not configured")
         
         if self._openai_client is None:
-            logger.info("Creating OpenAI client")
-            self._openai_client = AsyncOpenAI(api_key=settings.openai_api_key)
+            with self._init_lock:
+                if self._openai_client is None:
+                    logger.info("Creating OpenAI client")
+                    self._openai_client = AsyncOpenAI(
+                        api_key=settings.openai_api_key,
+                        http_client=self.get_http_client()
+                    )
         return self._openai_client
     
     def get_openai_model(self, model_name: str = "gpt-4") -> OpenAIChatCompletionsModel:
         """Get or create OpenAI model."""
         if self._openai_model is None:
-            logger.info("Creating OpenAI model", model=model_name)
-            client = self.get_openai_client()
-            self._openai_model = OpenAIChatCompletionsModel(
-                model=model_name,
-                openai_client=client
-            )
+            with self._init_lock:
+                if self._openai_model is None:
+                    logger.info("Creating OpenAI model", model=model_name)
+                    client = self.get_openai_client()
+                    self._openai_model = OpenAIChatCompletionsModel(
+                        model=model_name,
+                        openai_client=client
+                    )
         return self._openai_model
     
     def get_default_model(self) -> OpenAIChatCompletionsModel:
@@ -6,18 +6,14 @@ import asyncio
 import sys
 from typing import Optional
 
+from .core import model_provider
 from .services import app_service
+from .utils import weather_api_service
 from .config.logging import get_logger
 
 logger = get_logger(__name__)
 
-
-async def main_async():
-    """Main async function."""
-    try:
-        # Check for help flag
-        if "--help" in sys.argv or "-h" in sys.argv:
-            print("""
+_HELP_TEXT = """
 🤖 OpenAI App - Professional AI Assistant
 
 Usage:
@@ -38,20 +34,37 @@ Examples:
 
 For more advanced features, use the CLI commands:
   python -m src.openai_app.cli.commands --help
-            """)
+"""
+
+_HELP_FLAGS = frozenset({"--help", "-h"})
+_VERBOSE_FLAGS = frozenset({"--verbose", "-v"})
+_QUIET_FLAGS = frozenset({"--quiet", "-q"})
+_OUTPUT_FLAGS = _VERBOSE_FLAGS | _QUIET_FLAGS
+
+
+async def main_async():
+    """Main async function."""
+    # Scan the arguments once; flags are matched by set membership
+    argv = sys.argv[1:]
+    flags = set(argv)
+    verbose = not flags.isdisjoint(_VERBOSE_FLAGS)
+    
+    try:
+        # Check for help flag
+        if not flags.isdisjoint(_HELP_FLAGS):
+            print(_HELP_TEXT)
             return
         
-        # Check for verbose flag
-        verbose = "--verbose" in sys.argv or "-v" in sys.argv
-        quiet = "--quiet" in sys.argv or "-q" in sys.argv
+        # Check for quiet flag
+        quiet = not flags.isdisjoint(_QUIET_FLAGS)
         
         # Remove flags from arguments
-        args = [arg for arg in sys.argv[1:] if arg not in ["--verbose", "-v", "--quiet", "-q"]]
+        args = [arg for arg in argv if arg not in _OUTPUT_FLAGS]
         
         # Check if we have query arguments
         if args:
-            # Join all arguments as a single query
-            query = " ".join(args)
+            # Join all arguments as a single query (a quoted query is already one)
+            query = args[0] if len(args) == 1 else " ".join(args)
             
             # Run single query mode with appropriate quiet mode
             # Default is quiet unless verbose is specified
@@ -72,6 +85,11 @@ For more advanced features, use the CLI commands:
             logger.error("Application error", error=str(e))
         print(f"❌ Error: {str(e)}")
         sys.exit(1)
+    finally:
+        # Close pooled connections while the event loop is still running
+        await model_provider.aclose()
+        await weather_api_service.close()
+        weather_api_service.close_sync()
 
 
 def start():
@@ -79,7 +97,14 @@ def start():
     Application entry point for the script command.
     This function is called when you run: uv run openai-app
     """
-    asyncio.run(main_async())
+    # Prefer uvloop's faster event loop when the "perf" extra is installed
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+    
+    asyncio.run(main_async(), loop_factory=loop_factory)
 
 
 def main():
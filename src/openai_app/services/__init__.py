@@ -2,12 +2,17 @@
 Services module for OpenAI App.
 Contains business logic and application orchestration.
 """
-from .agent_service import AgentService, agent_service
+from .agent_service import AgentService, ConversationEntry, ToolCallRecord, agent_service
 from .app_service import AppService, app_service
+from .semantic_cache import SemanticResponseCache, semantic_cache
 
 __all__ = [
     "AgentService",
+    "ConversationEntry",
+    "ToolCallRecord",
     "agent_service",
     "AppService",
     "app_service",
+    "SemanticResponseCache",
+    "semantic_cache",
 ]
\ No newline at end of file
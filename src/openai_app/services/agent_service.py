@@ -1,27 +1,98 @@
 """
 Agent service for handling agent operations.
 """
-from typing import Optional, Dict, Any
-from agents import Agent, Runner
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Optional, Dict, Any, AsyncIterator, List
+from agents import Agent, Runner, RunResultStreaming
+from openai.types.responses import ResponseTextDeltaEvent
 
 from ..core import agent_factory, AgentError
-from ..config.logging import get_logger
+from ..config.settings import settings
+from ..config.logging import get_logger, info_enabled
 
 logger = get_logger(__name__)
 
 
+@dataclass(slots=True, frozen=True)
+class ToolCallRecord:
+    """A tool call made by the agent while processing an API message."""
+    tool_name: str
+    parameters: dict
+    result: Optional[str]
+    status: str
+    execution_time: Optional[float]
+
+
+@dataclass(slots=True)
+class ConversationEntry:
+    """A query and response recorded in the conversation history."""
+    query: str
+    response: str
+    agent: str
+    type: str
+    conversation_id: Optional[str] = None
+    tool_usage: List[ToolCallRecord] = field(default_factory=list)
+    instructions: Optional[str] = None
+
+
+def _dict_tool_call(tool_call: Dict[str, Any]) -> ToolCallRecord:
+    """Build a ToolCallRecord from a chat-completions style tool call dict."""
+    function = tool_call.get("function") or {}
+    return ToolCallRecord(
+        tool_name=function.get("name", "unknown"),
+        parameters=function.get("arguments", {}),
+        result=tool_call.get("result"),
+        status="success" if "result" in tool_call else "unknown",
+        execution_time=tool_call.get("execution_time")
+    )
+
+
+def _object_tool_call(tool_call: Any) -> ToolCallRecord:
+    """Build a ToolCallRecord from a tool call object."""
+    function = getattr(tool_call, "function", None)
+    result = getattr(tool_call, "result", None)
+    return ToolCallRecord(
+        tool_name=getattr(function, "name", "unknown"),
+        parameters=getattr(function, "arguments", {}),
+        result=result,
+        status="success" if hasattr(tool_call, "result") else "unknown",
+        execution_time=getattr(tool_call, "execution_time", None)
+    )
+
+
+async def _text_deltas(result: RunResultStreaming) -> AsyncIterator[str]:
+    """Yield the text deltas of a streamed run as the model generates them."""
+    async for event in result.stream_events():
+        if event.type == "raw_response_event" and isinstance(event.data, ResponseTextDeltaEvent):
+            yield event.data.delta
+
+
 class AgentService:
     """Service for managing agent operations."""
     
-    def __init__(self):
+    __slots__ = ("_current_agent", "_conversation_history", "_type_counts", "_quiet_mode")
+    
+    def __init__(self) -> None:
         self._current_agent: Optional[Agent] = None
-        self._conversation_history: list = []
+        self._conversation_history: deque[ConversationEntry] = deque(maxlen=settings.history_max or 1000)
+        self._type_counts: Counter[str] = Counter()
         self._quiet_mode: bool = False
     
-    def set_quiet_mode(self, quiet: bool):
+    def set_quiet_mode(self, quiet: bool) -> None:
         """Set quiet mode for this service."""
         self._quiet_mode = quiet
     
+    def _append(self, entry: ConversationEntry) -> None:
+        """Add an entry to the conversation history and count it by type."""
+        history = self._conversation_history
+        if len(history) == history.maxlen:
+            # The deque is about to evict its oldest entry
+            self._type_counts[history[0].type] -= 1
+        history.append(entry)
+        self._type_counts[entry.type] += 1
+    
     async def run_weather_query(
         self, 
         query: str, 
@@ -37,15 +108,15 @@ class AgentService:
         Returns:
             The agent's response
         """
-        logger.info("Running weather query", query=query[:50], agent=agent_name)
+        if not self._quiet_mode and info_enabled(__name__):
+            logger.info("Running weather query", query=query[:50], agent=agent_name)
         
         try:
             # Get or create weather agent
-            agent = agent_factory.get_agent(agent_name)
-            if agent is None:
-                if not self._quiet_mode:
-                    logger.info("Creating new weather agent", name=agent_name)
-                agent = agent_factory.create_weather_agent(agent_name)
+            agent = agent_factory.get_or_create(
+                agent_name,
+                partial(agent_factory.create_weather_agent, agent_name)
+            )
             
             self._current_agent = agent
             
@@ -53,16 +124,17 @@ class AgentService:
             result = await Runner.run(agent, query)
             
             # Store in conversation history
-            self._conversation_history.append({
-                "query": query,
-                "response": result.final_output,
-                "agent": agent_name,
-                "type": "weather"
-            })
+            self._append(ConversationEntry(
+                query=query,
+                response=result.final_output,
+                agent=agent_name,
+                type="weather"
+            ))
             
-            logger.info("Weather query completed", 
-                       query_length=len(query), 
-                       response_length=len(result.final_output))
+            if not self._quiet_mode and info_enabled(__name__):
+                logger.info("Weather query completed", 
+                           query_length=len(query), 
+                           response_length=len(result.final_output))
             
             return result.final_output
             
@@ -87,14 +159,15 @@ class AgentService:
         Returns:
             The agent's response
         """
-        logger.info("Running general query", query=query[:50], agent=agent_name)
+        if not self._quiet_mode and info_enabled(__name__):
+            logger.info("Running general query", query=query[:50], agent=agent_name)
         
         try:
             # Get or create general agent
-            agent = agent_factory.get_agent(agent_name)
-            if agent is None:
-                logger.info("Creating new general agent", name=agent_name)
-                agent = agent_factory.create_general_agent(agent_name, instructions)
+            agent = agent_factory.get_or_create(
+                agent_name,
+                partial(agent_factory.create_general_agent, agent_name, instructions)
+            )
             
             self._current_agent = agent
             
@@ -102,16 +175,17 @@ class AgentService:
             result = await Runner.run(agent, query)
             
             # Store in conversation history
-            self._conversation_history.append({
-                "query": query,
-                "response": result.final_output,
-                "agent": agent_name,
-                "type": "general"
-            })
+            self._append(ConversationEntry(
+                query=query,
+                response=result.final_output,
+                agent=agent_name,
+                type="general"
+            ))
             
-            logger.info("General query completed", 
-                       query_length=len(query), 
-                       response_length=len(result.final_output))
+            if not self._quiet_mode and info_enabled(__name__):
+                logger.info("General query completed", 
+                           query_length=len(query), 
+                           response_length=len(result.final_output))
             
             return result.final_output
             
@@ -119,6 +193,106 @@ class AgentService:
             logger.error("Error running general query", error=str(e))
             raise AgentError(f"Failed to run general query: {str(e)}")
     
+    async def run_weather_query_streamed(
+        self,
+        query: str,
+        agent_name: str = "Weather Assistant"
+    ) -> AsyncIterator[str]:
+        """
+        Run a weather-related query, streaming the response.
+        
+        Args:
+            query: The user's weather question
+            agent_name: Name of the agent to use
+            
+        Yields:
+            Text deltas of the agent's response as they arrive
+        """
+        if not self._quiet_mode and info_enabled(__name__):
+            logger.info("Streaming weather query", query=query[:50], agent=agent_name)
+        
+        try:
+            # Get or create weather agent
+            agent = agent_factory.get_or_create(
+                agent_name,
+                partial(agent_factory.create_weather_agent, agent_name)
+            )
+            
+            self._current_agent = agent
+            
+            # Forward text deltas from the model as they are generated
+            result = Runner.run_streamed(agent, query)
+            async for delta in _text_deltas(result):
+                yield delta
+            
+            # Store in conversation history
+            self._append(ConversationEntry(
+                query=query,
+                response=result.final_output,
+                agent=agent_name,
+                type="weather"
+            ))
+            
+            if not self._quiet_mode and info_enabled(__name__):
+                logger.info("Weather query streamed", 
+                           query_length=len(query), 
+                           response_length=len(result.final_output))
+            
+        except Exception as e:
+            logger.error("Error streaming weather query", error=str(e))
+            raise AgentError(f"Failed to stream weather query: {str(e)}")
+    
+    async def run_general_query_streamed(
+        self,
+        query: str,
+        agent_name: str = "General Assistant",
+        instructions: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Run a general query, streaming the response.
+        
+        Args:
+            query: The user's question
+            agent_name: Name of the agent to use
+            instructions: Custom instructions (optional)
+            
+        Yields:
+            Text deltas of the agent's response as they arrive
+        """
+        if not self._quiet_mode and info_enabled(__name__):
+            logger.info("Streaming general query", query=query[:50], agent=agent_name)
+        
+        try:
+            # Get or create general agent
+            agent = agent_factory.get_or_create(
+                agent_name,
+                partial(agent_factory.create_general_agent, agent_name, instructions)
+            )
+            
+            self._current_agent = agent
+            
+            # Forward text deltas from the model as they are generated
+            result = Runner.run_streamed(agent, query)
+            async for delta in _text_deltas(result):
+                yield delta
+            
+            # Store in conversation history
+            self._append(ConversationEntry(
+                query=query,
+                response=result.final_output,
+                agent=agent_name,
+                type="general"
+            ))
+            
+            if not self._quiet_mode and info_enabled(__name__):
+                logger.info("General query streamed", 
+                           query_length=len(query), 
+                           response_length=len(result.final_output))
+            
+        except Exception as e:
+            logger.error("Error streaming general query", error=str(e))
+            raise AgentError(f"Failed to stream general query: {str(e)}")
+    
     async def run_custom_query(
         self,
         query: str,
@@ -138,14 +312,15 @@ class AgentService:
         Returns:
             The agent's response
         """
-        logger.info("Running custom query", 
-                   query=query[:50], 
-                   agent=agent_name, 
-                   model=model_type)
+        if not self._quiet_mode and info_enabled(__name__):
+            logger.info("Running custom query", 
+                       query=query[:50], 
+                       agent=agent_name, 
+                       model=model_type)
         
         try:
-            # Create custom agent
-            agent = agent_factory.create_general_agent(
+            # Get or create custom agent
+            agent = agent_factory.get_or_create_general_agent(
                 name=agent_name,
                 instructions=instructions,
                 model_type=model_type
@@ -157,17 +332,18 @@ class AgentService:
             result = await Runner.run(agent, query)
             
             # Store in conversation history
-            self._conversation_history.append({
-                "query": query,
-                "response": result.final_output,
-                "agent": agent_name,
-                "type": "custom",
-                "instructions": instructions
-            })
-            
-            logger.info("Custom query completed", 
-                       query_length=len(query), 
-                       response_length=len(result.final_output))
+            self._append(ConversationEntry(
+                query=query,
+                response=result.final_output,
+                agent=agent_name,
+                type="custom",
+                instructions=instructions
+            ))
+            
+            if not self._quiet_mode and info_enabled(__name__):
+                logger.info("Custom query completed", 
+                           query_length=len(query), 
+                           response_length=len(result.final_output))
             
             return result.final_output
             
@@ -178,7 +354,7 @@ class AgentService:
     async def process_message(
         self,
         message: str,
-        conversation_id: str = None,
+        conversation_id: Optional[str] = None,
         agent_name: str = "AI Assistant"
     ) -> Dict[str, Any]:
         """
@@ -190,19 +366,20 @@ class AgentService:
             agent_name: Name of the agent to use
             
         Returns:
-            Dict containing response, conversation_id, and tool usage info
+            Dict containing response, conversation_id, and tool usage as ToolCallRecords
         """
-        logger.info("Processing API message", 
-                   message=message[:50], 
-                   conversation_id=conversation_id,
-                   agent=agent_name)
+        if not self._quiet_mode and info_enabled(__name__):
+            logger.info("Processing API message", 
+                       message=message[:50], 
+                       conversation_id=conversation_id,
+                       agent=agent_name)
         
         try:
             # Get or create agent
-            agent = agent_factory.get_agent(agent_name)
-            if agent is None:
-                logger.info("Creating new agent for API", name=agent_name)
-                agent = agent_factory.create_general_agent(agent_name)
+            agent = agent_factory.get_or_create(
+                agent_name,
+                partial(agent_factory.create_general_agent, agent_name)
+            )
             
             self._current_agent = agent
             
@@ -210,27 +387,24 @@ class AgentService:
             result = await Runner.run(agent, message)
             
             # Extract tool usage information from the result
-            tool_usage = []
-            if hasattr(result, 'tool_calls') and result.tool_calls:
-                for tool_call in result.tool_calls:
-                    tool_usage.append({
-                        "tool_name": tool_call.get("function", {}).get("name", "unknown"),
-                        "parameters": tool_call.get("function", {}).get("arguments", {}),
-                        "result": getattr(tool_call, 'result', None),
-                        "status": "success" if hasattr(tool_call, 'result') else "unknown",
-                        "execution_time": getattr(tool_call, 'execution_time', None)
-                    })
+            tool_calls = getattr(result, 'tool_calls', None)
+            if tool_calls:
+                # Tool calls are all dicts or all objects; pick the extractor once
+                extract = _dict_tool_call if isinstance(tool_calls[0], dict) else _object_tool_call
+                tool_usage = [extract(tool_call) for tool_call in tool_calls]
+            else:
+                tool_usage = []
             
             # Store in conversation history with API context
-            conversation_entry = {
-                "query": message,
-                "response": result.final_output,
-                "agent": agent_name,
-                "type": "api",
-                "conversation_id": conversation_id,
-                "tool_usage": tool_usage
-            }
-            self._conversation_history.append(conversation_entry)
+            conversation_entry = ConversationEntry(
+                query=message,
+                response=result.final_output,
+                agent=agent_name,
+                type="api",
+                conversation_id=conversation_id,
+                tool_usage=tool_usage
+            )
+            self._append(conversation_entry)
             
             response_data = {
                 "content": result.final_output,
@@ -238,9 +412,10 @@ class AgentService:
                 "tool_usage": tool_usage
             }
             
-            logger.info("API message processed successfully", 
-                       response_length=len(result.final_output),
-                       tools_used=len(tool_usage))
+            if not self._quiet_mode and info_enabled(__name__):
+                logger.info("API message processed successfully", 
+                           response_length=len(result.final_output),
+                           tools_used=len(tool_usage))
             
             return response_data
             
@@ -248,14 +423,71 @@ class AgentService:
             logger.error("Error processing API message", error=str(e))
             raise AgentError(f"Failed to process message: {str(e)}")
     
-    def get_conversation_history(self) -> list:
-        """Get the conversation history."""
-        return self._conversation_history.copy()
+    async def stream_message(
+        self,
+        message: str,
+        conversation_id: Optional[str] = None,
+        agent_name: str = "AI Assistant"
+    ) -> AsyncIterator[str]:
+        """
+        Stream a message through the AI agent for API usage.
+        
+        Args:
+            message: The user's message
+            conversation_id: Optional conversation ID for tracking
+            agent_name: Name of the agent to use
+        
+        Yields:
+            Text deltas of the agent's response as they arrive
+        """
+        if not self._quiet_mode and info_enabled(__name__):
+            logger.info("Streaming API message",
+                       message=message[:50],
+                       conversation_id=conversation_id,
+                       agent=agent_name)
+        
+        try:
+            # Get or create agent
+            agent = agent_factory.get_or_create(
+                agent_name,
+                partial(agent_factory.create_general_agent, agent_name)
+            )
+            
+            self._current_agent = agent
+            
+            # Forward text deltas from the model as they are generated
+            result = Runner.run_streamed(agent, message)
+            async for delta in _text_deltas(result):
+                yield delta
+            
+            # Store in conversation history with API context
+            self._append(ConversationEntry(
+                query=message,
+                response=result.final_output,
+                agent=agent_name,
+                type="api",
+                conversation_id=conversation_id,
+                tool_usage=[]
+            ))
+            
+            if not self._quiet_mode and info_enabled(__name__):
+                logger.info("API message streamed successfully",
+                           response_length=len(result.final_output))
+        
+        except Exception as e:
+            logger.error("Error streaming API message", error=str(e))
+            raise AgentError(f"Failed to stream message: {str(e)}")
+    
+    def get_conversation_history(self) -> tuple[ConversationEntry, ...]:
+        """Get an immutable snapshot of the conversation history."""
+        return tuple(self._conversation_history)
     
-    def clear_conversation_history(self):
+    def clear_conversation_history(self) -> None:
         """Clear the conversation history."""
         self._conversation_history.clear()
-        logger.info("Conversation history cleared")
+        self._type_counts.clear()
+        if not self._quiet_mode and info_enabled(__name__):
+            logger.info("Conversation history cleared")
     
     def get_current_agent(self) -> Optional[Agent]:
         """Get the currently active agent."""
@@ -265,10 +497,10 @@ class AgentService:
         """Get statistics about agent usage."""
         stats = {
             "total_conversations": len(self._conversation_history),
-            "weather_queries": len([c for c in self._conversation_history if c["type"] == "weather"]),
-            "general_queries": len([c for c in self._conversation_history if c["type"] == "general"]),
-            "custom_queries": len([c for c in self._conversation_history if c["type"] == "custom"]),
-            "api_queries": len([c for c in self._conversation_history if c["type"] == "api"]),
+            "weather_queries": self._type_counts["weather"],
+            "general_queries": self._type_counts["general"],
+            "custom_queries": self._type_counts["custom"],
+            "api_queries": self._type_counts["api"],
             "current_agent": self._current_agent.name if self._current_agent else None,
             "available_agents": agent_factory.list_agents()
         }
@@ -3,7 +3,8 @@ Main application service.
 Orchestrates the entire application flow.
 """
 import asyncio
-from typing import Optional, Dict, Any
+import re
+from typing import Optional, Dict, Any, AsyncIterator, List, Union
 
 from .agent_service import agent_service
 from ..config.settings import settings
@@ -13,10 +14,37 @@ from agents import set_tracing_disabled
 
 logger = get_logger(__name__)
 
+# Keywords that route an "auto" query to a specialised agent (substring match);
+# queries matching none of them go to the general agent
+_ROUTE_KEYWORDS = {
+    "weather": ("weather", "temperature", "rain", "sunny", "cloudy"),
+}
+
+# One alternation with a named group per query type, so routing is a single
+# scan of the query however many types are added
+_ROUTE_RE = re.compile(
+    "|".join(
+        f"(?P<{query_type}>{'|'.join(map(re.escape, keywords))})"
+        for query_type, keywords in _ROUTE_KEYWORDS.items()
+    ),
+    re.IGNORECASE
+)
+
+
+def _detect_query_type(query: str) -> str:
+    """Return the query type for the first routing keyword found in a query."""
+    match = _ROUTE_RE.search(query)
+    return match.lastgroup if match else "general"
+
+# Interactive commands that end the session
+_QUIT_COMMANDS = frozenset({"quit", "exit", "bye"})
+
 
 class AppService:
     """Main application service."""
     
+    __slots__ = ("_initialized", "_setup_complete")
+    
     def __init__(self):
         self._initialized = False
         self._setup_complete = False
@@ -65,6 +93,7 @@ class AppService:
     async def run_interactive_session(self):
         """Run an interactive chat session."""
         self.initialize(quiet_mode=True)  # Quiet mode for interactive sessions
+        agent_service.set_quiet_mode(True)
         
         print("🤖 Welcome to OpenAI App!")
         print("Type 'help' for commands, 'quit' to exit")
@@ -77,26 +106,31 @@ class AppService:
                 if not user_input:
                     continue
                 
-                if user_input.lower() in ['quit', 'exit', 'bye']:
+                cmd = user_input.lower()
+                
+                if cmd in _QUIT_COMMANDS:
                     print("👋 Goodbye!")
                     break
                 
-                if user_input.lower() == 'help':
+                if cmd == 'help':
                     self._show_help()
                     continue
                 
-                if user_input.lower() == 'stats':
+                if cmd == 'stats':
                     self._show_stats()
                     continue
                 
-                if user_input.lower() == 'clear':
+                if cmd == 'clear':
                     agent_service.clear_conversation_history()
                     print("🧹 Conversation history cleared!")
                     continue
                 
-                # Determine query type and route accordingly
-                response = await self._process_query(user_input)
-                print(f"\n🤖 Assistant: {response}")
+                # Determine query type and route accordingly, printing the
+                # response as it streams in
+                print("\n🤖 Assistant: ", end="", flush=True)
+                async for chunk in self.stream_single_query(user_input):
+                    print(chunk, end="", flush=True)
+                print()
                 
             except KeyboardInterrupt:
                 print("\n\n👋 Goodbye!")
@@ -126,16 +160,14 @@ class AppService:
             logger.info("Running single query", query=query[:50], type=query_type)
         
         try:
+            if query_type == "auto":
+                # Auto-detect query type
+                query_type = _detect_query_type(query)
+            
             if query_type == "weather":
                 return await agent_service.run_weather_query(query)
             elif query_type == "general":
                 return await agent_service.run_general_query(query)
-            elif query_type == "auto":
-                # Auto-detect query type
-                if any(word in query.lower() for word in ['weather', 'temperature', 'rain', 'sunny', 'cloudy']):
-                    return await agent_service.run_weather_query(query)
-                else:
-                    return await agent_service.run_general_query(query)
             else:
                 raise ValueError(f"Unknown query type: {query_type}")
                 
@@ -144,13 +176,57 @@ class AppService:
                 logger.error("Error running single query", error=str(e))
             raise OpenAIAppError(f"Failed to process query: {str(e)}")
     
-    def _process_query(self, query: str) -> str:
-        """Process a query and return response."""
-        return asyncio.create_task(self.run_single_query(query))
+    async def run_queries(self, queries: List[str], query_type: str = "auto") -> List[Union[str, Exception]]:
+        """
+        Run independent queries concurrently and return their responses.
+        
+        At most ``settings.max_concurrent_queries`` queries are in flight at
+        once to stay within the provider's rate limits. A failed query does
+        not affect the others; its exception takes the place of its response.
+        
+        Args:
+            queries: The user's questions
+            query_type: Type of query ("weather", "general", "auto")
+            
+        Returns:
+            The agent's responses or the errors raised, in the same order as the queries
+        """
+        semaphore = asyncio.Semaphore(settings.max_concurrent_queries)
+        
+        async def run_one(query: str) -> str:
+            async with semaphore:
+                return await self.run_single_query(query, query_type, quiet_mode=True)
+        
+        return await asyncio.gather(*(run_one(query) for query in queries), return_exceptions=True)
     
-    async def _process_query(self, query: str) -> str:
-        """Process a query and return response."""
-        return await self.run_single_query(query)
+    async def stream_single_query(self, query: str, query_type: str = "auto") -> AsyncIterator[str]:
+        """
+        Run a single query and stream the response.
+        
+        Args:
+            query: The user's question
+            query_type: Type of query ("weather", "general", "auto")
+            
+        Yields:
+            Text chunks of the agent's response as they arrive
+        """
+        try:
+            if query_type == "auto":
+                # Auto-detect query type
+                query_type = _detect_query_type(query)
+            
+            if query_type == "weather":
+                stream = agent_service.run_weather_query_streamed(query)
+            elif query_type == "general":
+                stream = agent_service.run_general_query_streamed(query)
+            else:
+                raise ValueError(f"Unknown query type: {query_type}")
+            
+            async for chunk in stream:
+                yield chunk
+                
+        except Exception as e:
+            raise OpenAIAppError(f"Failed to process query: {str(e)}")
     
     def _show_help(self):
         """Show help information."""
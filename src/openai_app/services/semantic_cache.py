@@ -0,0 +1,295 @@
+"""
+Semantic response cache for the chat API.
+Serves near-duplicate messages within a conversation without running the agent.
+"""
+import asyncio
+import math
+from array import array
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Optional, Sequence, Tuple
+
+from ..core import model_provider
+from ..config.settings import settings
+from ..config.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """A cached agent response and the embedding of the message that produced it."""
+    # Packed float32 values take 4 bytes per dimension instead of a boxed float each
+    embedding: "array[float]"
+    norm: float
+    response: str
+    expires_at: float
+
+
+class EmbeddingBatcher:
+    """
+    Coalesce concurrent embedding requests into batched API calls.
+
+    Requests arriving within a short window are sent as one embeddings call,
+    so concurrent users share a single round-trip.
+    """
+
+    def __init__(
+        self,
+        embed_batch: Callable[[List[str]], Awaitable[List[List[float]]]],
+        max_batch_size: int = 32,
+        max_wait: float = 0.008
+    ):
+        self._embed_batch = embed_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def embed(self, text: str) -> List[float]:
+        """
+        Queue a text for the next batch and wait for its embedding.
+
+        Args:
+            text: The text to embed
+
+        Returns:
+            The embedding vector
+        """
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    def _ensure_worker(self):
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._worker.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+    async def _run(self):
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                deadline = time.monotonic() + self.max_wait
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                embeddings = await self._embed_batch([text for text, _ in batch])
+                if len(embeddings) != len(batch):
+                    raise RuntimeError(
+                        f"Embeddings API returned {len(embeddings)} embeddings for {len(batch)} inputs"
+                    )
+            except BaseException as e:
+                # Resolve every waiter in the batch so none of them hangs;
+                # cancellation still stops the worker afterwards
+                _fail_pending(batch, e)
+                if isinstance(e, asyncio.CancelledError):
+                    raise
+                continue
+
+            for (_, future), embedding in zip(batch, embeddings):
+                if not future.done():
+                    future.set_result(embedding)
+
+    async def close(self):
+        """Stop the background batching task."""
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+
+        # Requests still queued will never be batched now
+        if self._queue is not None:
+            pending = []
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+            _fail_pending(pending, asyncio.CancelledError())
+
+
+class SemanticResponseCache:
+    """Conversation-scoped cache of agent responses keyed by message embedding."""
+
+    def __init__(
+        self,
+        threshold: float = 0.1,
+        ttl: float = 1800,
+        max_conversations: int = 1000,
+        max_entries_per_conversation: int = 100,
+        max_entries: int = 10000
+    ):
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_conversations = max_conversations
+        self.max_entries_per_conversation = max_entries_per_conversation
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, List[CacheEntry]]" = OrderedDict()
+        self._size = 0
+        self._batcher = EmbeddingBatcher(self._embed_batch)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is switched on in settings."""
+        return settings.semantic_cache_enabled
+
+    async def embed(self, text: str) -> List[float]:
+        """
+        Embed a message with the configured embedding model.
+
+        Concurrent calls are batched into a single embeddings request.
+
+        Args:
+            text: The text to embed
+
+        Returns:
+            The embedding vector
+        """
+        return await self._batcher.embed(text)
+
+    async def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        client = model_provider.get_gemini_client()
+        response = await client.embeddings.create(
+            model=settings.embedding_model,
+            input=texts
+        )
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+    async def lookup(
+        self,
+        conversation_id: str,
+        message: str
+    ) -> Tuple[Optional[str], Optional[List[float]]]:
+        """
+        Find a cached response for a semantically similar message.
+
+        Args:
+            conversation_id: Conversation the message belongs to
+            message: The user's message
+
+        Returns:
+            Tuple of (cached response or None, message embedding or None).
+            The embedding is returned so a miss can be stored without re-embedding.
+        """
+        try:
+            embedding = await self.embed(message)
+        except Exception as e:
+            logger.warning("Semantic cache embedding failed", error=str(e))
+            return None, None
+
+        entries = self._entries.get(conversation_id)
+        if not entries:
+            return None, embedding
+
+        now = time.monotonic()
+        live = [entry for entry in entries if entry.expires_at > now]
+        self._size -= len(entries) - len(live)
+        entries[:] = live
+
+        norm = _norm(embedding)
+        best: Optional[CacheEntry] = None
+        best_distance = self.threshold
+        for entry in entries:
+            distance = _cosine_distance(embedding, norm, entry.embedding, entry.norm)
+            if distance <= best_distance:
+                best, best_distance = entry, distance
+
+        if best is None:
+            return None, embedding
+
+        # Refresh the TTL on hit, mirroring a read-with-expiry
+        best.expires_at = now + self.ttl
+        self._entries.move_to_end(conversation_id)
+        logger.info("Semantic cache hit", conversation_id=conversation_id, distance=round(best_distance, 4))
+        return best.response, embedding
+
+    async def store(
+        self,
+        conversation_id: str,
+        message: str,
+        response: str,
+        embedding: Optional[List[float]] = None
+    ):
+        """
+        Cache an agent response for a conversation.
+
+        Args:
+            conversation_id: Conversation the message belongs to
+            message: The user's message
+            response: The agent's response
+            embedding: Precomputed embedding of the message (optional)
+        """
+        if embedding is None:
+            try:
+                embedding = await self.embed(message)
+            except Exception as e:
+                logger.warning("Semantic cache embedding failed", error=str(e))
+                return
+
+        entries = self._entries.setdefault(conversation_id, [])
+        entries.append(CacheEntry(
+            embedding=array("f", embedding),
+            norm=_norm(embedding),
+            response=response,
+            expires_at=time.monotonic() + self.ttl
+        ))
+        if len(entries) > self.max_entries_per_conversation:
+            del entries[0]
+        else:
+            self._size += 1
+
+        # Conversation IDs come from clients, so bound the total entry count as
+        # well as the number of conversations
+        self._entries.move_to_end(conversation_id)
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_conversations or self._size > self.max_entries
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    async def close(self):
+        """Stop background embedding work."""
+        await self._batcher.close()
+
+    def clear(self, conversation_id: Optional[str] = None):
+        """Clear cached responses for one conversation, or all of them."""
+        if conversation_id is None:
+            self._entries.clear()
+            self._size = 0
+        else:
+            self._size -= len(self._entries.pop(conversation_id, ()))
+
+
+def _fail_pending(batch: List[Tuple[str, asyncio.Future]], error: BaseException):
+    for _, future in batch:
+        if not future.done():
+            if isinstance(error, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(error)
+
+
+def _norm(vector: Sequence[float]) -> float:
+    return math.sqrt(math.sumprod(vector, vector))
+
+
+def _cosine_distance(a: Sequence[float], a_norm: float, b: Sequence[float], b_norm: float) -> float:
+    if not a_norm or not b_norm:
+        return 1.0
+    return 1.0 - math.sumprod(a, b) / (a_norm * b_norm)
+
+
+# Create global semantic cache instance
+semantic_cache = SemanticResponseCache(
+    threshold=settings.semantic_cache_threshold,
+    ttl=settings.semantic_cache_ttl
+)
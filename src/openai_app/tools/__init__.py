@@ -3,19 +3,32 @@ Tools module for OpenAI App.
 Provides weather and calculator tools for the AI agents.
 """
 from .base import BaseTool
-from .weather import WeatherTool, weather_tool
+from .weather import WeatherTool, WeatherBatchTool, weather_tool, weather_batch_tool
 from .calculator import CalculatorTool, calculator_tool
-from .registry import ToolRegistry, tool_registry
-from .search import SearchTool, search_tool
+from .registry import (
+    ToolRegistry,
+    tool_registry,
+    ToolNotFound,
+    ToolValidationError,
+    ToolRuntimeError,
+)
+from .search import SearchTool, SearchBatchTool, search_tool, search_batch_tool
 
 __all__ = [
     "BaseTool",
     "WeatherTool",
     "weather_tool",
+    "WeatherBatchTool",
+    "weather_batch_tool",
     "CalculatorTool",
     "calculator_tool",
     "SearchTool",
     "search_tool",
+    "SearchBatchTool",
+    "search_batch_tool",
     "ToolRegistry", 
     "tool_registry",
+    "ToolNotFound",
+    "ToolValidationError",
+    "ToolRuntimeError",
 ]
\ No newline at end of file
@@ -1,10 +1,17 @@
 """
 Base classes and interfaces for tools.
 """
+import asyncio
+import atexit
+import concurrent.futures
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 from agents.tool import function_tool
 
+# Worker threads for execute_sync calls made while an event loop is running
+_SYNC_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="tool-sync")
+atexit.register(_SYNC_EXECUTOR.shutdown, wait=False)
+
 
 class BaseTool(ABC):
     """Base class for all tools in the application."""
@@ -12,6 +19,7 @@ class BaseTool(ABC):
     def __init__(self, name: str, description: str):
         self._name = name
         self._description = description
+        self._function_tool = None
     
     @property
     def name(self) -> str:
@@ -36,19 +44,23 @@ class BaseTool(ABC):
     
     def execute_sync(self, **kwargs) -> str:
         """Sync execution method for function tools"""
-        import asyncio
         try:
-            return asyncio.run(self.execute(**kwargs))
+            asyncio.get_running_loop()
         except RuntimeError:
-            # If there's already an event loop running
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, self.execute(**kwargs))
-                return future.result()
+            return asyncio.run(self.execute(**kwargs))
+        
+        # If there's already an event loop running, run on a worker thread's own loop
+        return _SYNC_EXECUTOR.submit(lambda: asyncio.run(self.execute(**kwargs))).result()
     
-    @abstractmethod
     def get_function_tool(self):
-        """Return the function_tool decorated version of this tool."""
+        """Return the function_tool decorated version of this tool, built once and shared."""
+        if self._function_tool is None:
+            self._function_tool = self._build_function_tool()
+        return self._function_tool
+    
+    @abstractmethod
+    def _build_function_tool(self):
+        """Build the function_tool decorated version of this tool."""
         pass
     
     def __str__(self) -> str:
@@ -2,9 +2,11 @@
 Calculator tool implementation.
 """
 import ast
+import functools
 import operator
 import math
-from typing import Optional, Any, Dict
+from types import CodeType, MappingProxyType
+from typing import Optional, Any, Dict, ClassVar
 from agents.tool import function_tool
 
 from .base import BaseTool
@@ -13,98 +15,160 @@ from ..config.logging import get_logger
 logger = get_logger(__name__)
 
 
+
+# Allowed operators
+OPERATORS = MappingProxyType({
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Pow: operator.pow,
+    ast.Mod: operator.mod,
+    ast.FloorDiv: operator.floordiv,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+})
+
+# Allowed functions
+FUNCTIONS = MappingProxyType({
+    'abs': abs,
+    'round': round,
+    'min': min,
+    'max': max,
+    'sum': sum,
+    'sqrt': math.sqrt,
+    'sin': math.sin,
+    'cos': math.cos,
+    'tan': math.tan,
+    'log': math.log,
+    'log10': math.log10,
+    'exp': math.exp,
+    'ceil': math.ceil,
+    'floor': math.floor,
+    'pi': math.pi,
+    'e': math.e,
+})
+
+# Namespace compiled expressions run in; built once and never mutated
+_EVAL_GLOBALS = {"__builtins__": {}, **FUNCTIONS}
+
+
+def safe_eval(expression: str) -> float:
+    """Safely evaluate a mathematical expression."""
+    try:
+        # Parse, validate and compile the expression (cached)
+        code = _compile_expr(expression)
+        return eval(code, _EVAL_GLOBALS)
+    except Exception as e:
+        raise ValueError(f"Invalid expression: {str(e)}")
+
+
 class SafeMathEvaluator:
     """Safe mathematical expression evaluator."""
     
-    # Allowed operators
-    operators = {
-        ast.Add: operator.add,
-        ast.Sub: operator.sub,
-        ast.Mult: operator.mul,
-        ast.Div: operator.truediv,
-        ast.Pow: operator.pow,
-        ast.Mod: operator.mod,
-        ast.FloorDiv: operator.floordiv,
-        ast.USub: operator.neg,
-        ast.UAdd: operator.pos,
-    }
+    # Read-only views shared by every evaluator
+    operators = OPERATORS
+    functions = FUNCTIONS
     
-    # Allowed functions
-    functions = {
-        'abs': abs,
-        'round': round,
-        'min': min,
-        'max': max,
-        'sum': sum,
-        'sqrt': math.sqrt,
-        'sin': math.sin,
-        'cos': math.cos,
-        'tan': math.tan,
-        'log': math.log,
-        'log10': math.log10,
-        'exp': math.exp,
-        'ceil': math.ceil,
-        'floor': math.floor,
-        'pi': math.pi,
-        'e': math.e,
-    }
+    evaluate = staticmethod(safe_eval)
+
+
+def _allow(node: ast.AST):
+    """Accept a node that needs no further checks."""
+
+
+def _check_name(node: ast.Name):
+    """Only allow names of the whitelisted functions and constants."""
+    if node.id not in FUNCTIONS:
+        raise ValueError(f"Unknown variable: {node.id}")
+
+
+# Validator for each node type an expression may contain; anything else is rejected
+_NODE_VALIDATORS = {
+    ast.Expression: _allow,
+    ast.BinOp: _allow,
+    ast.UnaryOp: _allow,
+    ast.Call: _allow,
+    ast.Constant: _allow,
+    ast.Name: _check_name,
+    ast.List: _allow,
+    ast.Tuple: _allow,
+    ast.Load: _allow,
+    **{op: _allow for op in OPERATORS},
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_expr(expression: str) -> CodeType:
+    """
+    Parse, validate and compile an expression.
     
-    def evaluate(self, expression: str) -> float:
-        """Safely evaluate a mathematical expression."""
+    Every node is checked against the whitelist before compiling, so the
+    resulting code can only call the allowed functions; evaluation then
+    runs in the interpreter instead of a Python-level tree walk. Results
+    are cached because the agent often repeats the same calculation.
+    """
+    tree = ast.parse(expression.strip(), mode='eval')
+    for node in ast.walk(tree):
         try:
-            # Parse the expression
-            node = ast.parse(expression.strip(), mode='eval')
-            return self._eval(node.body)
-        except Exception as e:
-            raise ValueError(f"Invalid expression: {str(e)}")
+            validate = _NODE_VALIDATORS[type(node)]
+        except KeyError:
+            raise ValueError(f"Unsupported node type: {type(node).__name__}") from None
+        validate(node)
+    return compile(tree, '<calc>', 'eval')
+
+
+_evaluator = SafeMathEvaluator()
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_calc(expression: str) -> str:
+    """
+    Evaluate an expression and format the tool response.
+    
+    Calculations are pure, so the formatted response (or error message)
+    is cached per expression and repeated calls skip evaluation entirely.
+    """
+    try:
+        result = safe_eval(expression)
+    except Exception as e:
+        logger.error("Calculation failed", expression=expression, error=str(e))
+        return f"Error calculating '{expression}': {str(e)}"
     
-    def _eval(self, node: ast.AST) -> Any:
-        """Recursively evaluate AST nodes."""
-        if isinstance(node, ast.Constant):  # Python 3.8+
-            return node.value
-        elif isinstance(node, ast.Num):  # Python < 3.8 compatibility
-            return node.n
-        elif isinstance(node, ast.Name):
-            if node.id in self.functions:
-                return self.functions[node.id]
-            else:
-                raise ValueError(f"Unknown variable: {node.id}")
-        elif isinstance(node, ast.BinOp):
-            left = self._eval(node.left)
-            right = self._eval(node.right)
-            op = self.operators.get(type(node.op))
-            if op is None:
-                raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
-            return op(left, right)
-        elif isinstance(node, ast.UnaryOp):
-            operand = self._eval(node.operand)
-            op = self.operators.get(type(node.op))
-            if op is None:
-                raise ValueError(f"Unsupported unary operator: {type(node.op).__name__}")
-            return op(operand)
-        elif isinstance(node, ast.Call):
-            func = self._eval(node.func)
-            if not callable(func):
-                raise ValueError(f"Not a function: {func}")
-            args = [self._eval(arg) for arg in node.args]
-            return func(*args)
-        elif isinstance(node, ast.List):
-            return [self._eval(item) for item in node.elts]
-        elif isinstance(node, ast.Tuple):
-            return tuple(self._eval(item) for item in node.elts)
+    # Format the result nicely
+    if isinstance(result, float):
+        if result.is_integer():
+            formatted_result = str(int(result))
         else:
-            raise ValueError(f"Unsupported node type: {type(node).__name__}")
+            formatted_result = f"{result:.10g}"  # Remove trailing zeros
+    else:
+        formatted_result = str(result)
+    
+    logger.info("Calculation completed", expression=expression, result=formatted_result)
+    return f"{expression} = {formatted_result}"
 
 
 class CalculatorTool(BaseTool):
     """Tool for performing mathematical calculations."""
     
+    # Static JSON schema returned by `parameters`
+    _PARAMETERS: ClassVar[Dict[str, Any]] = {
+        "type": "object",
+        "properties": {
+            "expression": {
+                "type": "string",
+                "description": "Mathematical expression to evaluate (e.g., '2 + 2', '10 * 5', 'sqrt(16)')"
+            }
+        },
+        "required": ["expression"]
+    }
+    
     def __init__(self):
         super().__init__(
             name="calculate",
             description="Perform mathematical calculations including basic arithmetic, functions, and scientific operations"
         )
-        self.evaluator = SafeMathEvaluator()
+        self.evaluator = _evaluator
     
     async def execute(self, expression: str) -> str:
         """
@@ -117,44 +181,15 @@ class CalculatorTool(BaseTool):
             Calculation result as a string
         """
         logger.info("Calculating expression", expression=expression)
-        
-        try:
-            result = self.evaluator.evaluate(expression)
-            
-            # Format the result nicely
-            if isinstance(result, float):
-                if result.is_integer():
-                    formatted_result = str(int(result))
-                else:
-                    formatted_result = f"{result:.10g}"  # Remove trailing zeros
-            else:
-                formatted_result = str(result)
-            
-            response = f"{expression} = {formatted_result}"
-            logger.info("Calculation completed", expression=expression, result=formatted_result)
-            return response
-            
-        except Exception as e:
-            error_msg = f"Error calculating '{expression}': {str(e)}"
-            logger.error("Calculation failed", expression=expression, error=str(e))
-            return error_msg
+        return _cached_calc(expression)
     
     @property
     def parameters(self) -> Dict[str, Any]:
         """JSON schema for calculator tool parameters"""
-        return {
-            "type": "object",
-            "properties": {
-                "expression": {
-                    "type": "string",
-                    "description": "Mathematical expression to evaluate (e.g., '2 + 2', '10 * 5', 'sqrt(16)')"
-                }
-            },
-            "required": ["expression"]
-        }
+        return self._PARAMETERS
     
-    def get_function_tool(self):
-        """Return the function_tool decorated version."""
+    def _build_function_tool(self):
+        """Build the function_tool decorated version."""
         
         @function_tool
         def calculate(expression: str) -> str:
@@ -173,27 +208,7 @@ class CalculatorTool(BaseTool):
                 - Scientific: "sin(pi/2)" → "sin(pi/2) = 1"
             """
             logger.info("Calculating expression via function tool", expression=expression)
-            
-            try:
-                result = self.evaluator.evaluate(expression)
-                
-                # Format the result nicely
-                if isinstance(result, float):
-                    if result.is_integer():
-                        formatted_result = str(int(result))
-                    else:
-                        formatted_result = f"{result:.10g}"  # Remove trailing zeros
-                else:
-                    formatted_result = str(result)
-                
-                response = f"{expression} = {formatted_result}"
-                logger.info("Calculation completed via function tool", expression=expression, result=formatted_result)
-                return response
-                
-            except Exception as e:
-                error_msg = f"Error calculating '{expression}': {str(e)}"
-                logger.error("Calculation failed via function tool", expression=expression, error=str(e))
-                return error_msg
+            return _cached_calc(expression)
         
         return calculate
 
@@ -1,29 +1,46 @@
 """
 Tool registry for managing all available tools.
 """
-from typing import Dict, List
+import inspect
+from typing import Any, Dict, List, Optional, Tuple
 from .base import BaseTool
-from .weather import weather_tool
+from .weather import weather_tool, weather_batch_tool
 from .calculator import calculator_tool
-from .search import search_tool
+from .search import search_tool, search_batch_tool
 from ..config.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+class ToolNotFound(ValueError):
+    """Raised when no tool is registered under the requested name."""
+    code = "tool_not_found"
+
+
+class ToolValidationError(ValueError):
+    """Raised when a tool is called with parameters it does not accept."""
+    code = "invalid_parameters"
+
+
+class ToolRuntimeError(RuntimeError):
+    """Raised when a tool fails while executing."""
+    code = "execution_failed"
+
+
 class ToolRegistry:
     """Registry for managing all available tools."""
     
-    def __init__(self):
+    def __init__(self, quiet: bool = False):
         self._tools: Dict[str, BaseTool] = {}
-        self._quiet_mode = False
+        self._signatures: Dict[str, inspect.Signature] = {}
+        self._function_tools: Optional[Tuple] = None
+        self._quiet_mode = quiet
         self._initialized = False
+        self._register_default_tools()
     
     def set_quiet_mode(self, quiet: bool):
         """Set quiet mode for this registry."""
         self._quiet_mode = quiet
-        if not self._initialized:
-            self._register_default_tools()
     
     def _register_default_tools(self):
         """Register the default tools."""
@@ -33,6 +50,8 @@ class ToolRegistry:
         self.register_tool(weather_tool)
         self.register_tool(calculator_tool)
         self.register_tool(search_tool)
+        self.register_tool(weather_batch_tool)
+        self.register_tool(search_batch_tool)
         if not self._quiet_mode:
             logger.info("Default tools registered", tool_count=len(self._tools))
         self._initialized = True
@@ -40,33 +59,57 @@ class ToolRegistry:
     def register_tool(self, tool: BaseTool):
         """Register a new tool."""
         self._tools[tool.name] = tool
+        self._signatures[tool.name] = inspect.signature(tool.execute)
+        self._function_tools = None
         if not self._quiet_mode:
             logger.info("Tool registered", tool_name=tool.name)
     
     def get_tool(self, name: str) -> BaseTool:
         """Get a tool by name."""
-        if not self._initialized:
-            self._register_default_tools()
         if name not in self._tools:
-            raise ValueError(f"Tool '{name}' not found. Available tools: {list(self._tools.keys())}")
+            raise ToolNotFound(f"Tool '{name}' not found. Available tools: {list(self._tools.keys())}")
         return self._tools[name]
     
+    async def execute_tool(self, name: str, parameters: Dict[str, Any]) -> str:
+        """
+        Execute a tool by name.
+        
+        Args:
+            name: Name of the tool to execute
+            parameters: Keyword arguments for the tool
+            
+        Returns:
+            The tool's result
+            
+        Raises:
+            ToolNotFound: If no tool is registered under the name
+            ToolValidationError: If the parameters do not match the tool's signature
+            ToolRuntimeError: If the tool fails while executing
+        """
+        tool = self.get_tool(name)
+        try:
+            self._signatures[name].bind(**parameters)
+        except TypeError as e:
+            raise ToolValidationError(name) from e
+        
+        try:
+            return await tool.execute(**parameters)
+        except Exception as e:
+            raise ToolRuntimeError(name) from e
+    
     def get_all_tools(self) -> List[BaseTool]:
         """Get all registered tools."""
-        if not self._initialized:
-            self._register_default_tools()
         return list(self._tools.values())
     
     def get_function_tools(self) -> List:
         """Get all tools as function_tool decorated functions."""
-        if not self._initialized:
-            self._register_default_tools()
-        return [tool.get_function_tool() for tool in self._tools.values()]
+        # Built once and rebuilt only after a tool is registered
+        if self._function_tools is None:
+            self._function_tools = tuple(tool.get_function_tool() for tool in self._tools.values())
+        return list(self._function_tools)
     
     def list_tools(self) -> List[str]:
         """List all available tool names."""
-        if not self._initialized:
-            self._register_default_tools()
         return list(self._tools.keys())
     
     def __len__(self) -> int:
@@ -76,5 +119,6 @@ class ToolRegistry:
         return f"ToolRegistry(tools={list(self._tools.keys())})"
 
 
-# Create global registry instance
-tool_registry = ToolRegistry()
+# Create global registry instance. It is built at import time, before logging
+# is configured, so the default tool registrations are not logged.
+tool_registry = ToolRegistry(quiet=True)
@@ -1,11 +1,11 @@
 """
 Search tool implementation with Tavily web search.
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, ClassVar, List
 from agents.tool import function_tool
 
 from .base import BaseTool
-from ..config.logging import get_logger
+from ..config.logging import get_logger, info_enabled
 from ..utils.search_api import search_api_service
 
 logger = get_logger(__name__)
@@ -14,6 +14,25 @@ logger = get_logger(__name__)
 class SearchTool(BaseTool):
     """Tool for performing web searches."""
     
+    # Static JSON schema returned by `parameters`
+    _PARAMETERS: ClassVar[Dict[str, Any]] = {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Search query to find information about"
+            },
+            "max_results": {
+                "type": "integer",
+                "description": "Maximum number of search results to return (default: 5)",
+                "default": 5,
+                "minimum": 1,
+                "maximum": 10
+            }
+        },
+        "required": ["query"]
+    }
+    
     def __init__(self):
         super().__init__(
             name="search_web",
@@ -31,16 +50,18 @@ class SearchTool(BaseTool):
         Returns:
             Formatted search results as a string
         """
-        logger.info("Performing web search", query=query, max_results=max_results)
+        if info_enabled(__name__):
+            logger.info("Performing web search", query=query, max_results=max_results)
         
         # Use search API service
         result = await search_api_service.search_web(query, max_results)
         
-        logger.info("Web search completed", query=query, result_length=len(result))
+        if info_enabled(__name__):
+            logger.info("Web search completed", query=query, result_length=len(result))
         return result
     
-    def get_function_tool(self):
-        """Return the function_tool decorated version."""
+    def _build_function_tool(self):
+        """Build the function_tool decorated version."""
         
         @function_tool
         def search_web(query: str, max_results: Optional[int] = None) -> str:
@@ -54,11 +75,13 @@ class SearchTool(BaseTool):
             Returns:
                 Formatted search results with titles, URLs, and summaries
             """
-            logger.info("Performing web search via function tool", query=query, max_results=max_results)
+            if info_enabled(__name__):
+                logger.info("Performing web search via function tool", query=query, max_results=max_results)
             
             try:
                 result = search_api_service.search_web_sync(query, max_results)
-                logger.info("Web search completed via function tool", query=query, result_length=len(result))
+                if info_enabled(__name__):
+                    logger.info("Web search completed via function tool", query=query, result_length=len(result))
                 return result
                 
             except Exception as e:
@@ -70,24 +93,90 @@ class SearchTool(BaseTool):
     @property
     def parameters(self) -> Dict[str, Any]:
         """JSON schema for search tool parameters"""
-        return {
-            "type": "object",
-            "properties": {
-                "query": {
-                    "type": "string",
-                    "description": "Search query to find information about"
-                },
-                "max_results": {
-                    "type": "integer",
-                    "description": "Maximum number of search results to return (default: 5)",
-                    "default": 5,
-                    "minimum": 1,
-                    "maximum": 10
-                }
+        return self._PARAMETERS
+    
+
+class SearchBatchTool(BaseTool):
+    """Tool for performing several web searches in one call."""
+    
+    # Static JSON schema returned by `parameters`
+    _PARAMETERS: ClassVar[Dict[str, Any]] = {
+        "type": "object",
+        "properties": {
+            "queries": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Search queries to run"
             },
-            "required": ["query"]
-        }
+            "max_results": {
+                "type": "integer",
+                "description": "Maximum number of search results per query (default: 5)",
+                "default": 5,
+                "minimum": 1,
+                "maximum": 10
+            }
+        },
+        "required": ["queries"]
+    }
+    
+    def __init__(self):
+        super().__init__(
+            name="search_web_batch",
+            description="Run several independent web searches at once"
+        )
+    
+    @property
+    def parameters(self) -> Dict[str, Any]:
+        """JSON schema for batch search tool parameters"""
+        return self._PARAMETERS
+    
+    async def execute(self, queries: List[str], max_results: Optional[int] = None) -> str:
+        """
+        Perform several web searches concurrently.
+        
+        Args:
+            queries: The search queries
+            max_results: Optional maximum number of results per query (default: 5)
+            
+        Returns:
+            Formatted search results for each query
+        """
+        if info_enabled(__name__):
+            logger.info("Performing web searches", queries=queries, max_results=max_results)
+        
+        results = await search_api_service.search_web_batch(queries, max_results)
+        return "\n\n".join(results)
     
+    def _build_function_tool(self):
+        """Build the function_tool decorated version."""
+        
+        @function_tool
+        async def search_web_batch(queries: List[str], max_results: Optional[int] = None) -> str:
+            """
+            Search the internet for several independent queries at once.
+            
+            Args:
+                queries: The search query strings
+                max_results: Maximum number of results per query (default: 5)
+            
+            Returns:
+                Formatted search results for each query
+            """
+            if info_enabled(__name__):
+                logger.info("Performing web searches via function tool", queries=queries, max_results=max_results)
+            
+            # The searches run concurrently in worker threads
+            try:
+                results = await search_api_service.search_web_batch(queries, max_results)
+                return "\n\n".join(results)
+                
+            except Exception as e:
+                logger.error("Error performing web searches via function tool", error=str(e), queries=queries)
+                return "Unable to search the web at the moment. Please try again later."
+        
+        return search_web_batch
+
 
-# Create a global instance for easy import
-search_tool = SearchTool()
\ No newline at end of file
+# Create global instances for easy import
+search_tool = SearchTool()
+search_batch_tool = SearchBatchTool()
@@ -1,11 +1,11 @@
 """
 Weather tool implementation with real API.
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, ClassVar, List
 from agents.tool import function_tool
 
 from .base import BaseTool
-from ..config.logging import get_logger
+from ..config.logging import get_logger, info_enabled
 from ..utils.weather_api import weather_api_service
 
 logger = get_logger(__name__)
@@ -14,6 +14,23 @@ logger = get_logger(__name__)
 class WeatherTool(BaseTool):
     """Tool for getting weather information."""
     
+    # Static JSON schema returned by `parameters`
+    _PARAMETERS: ClassVar[Dict[str, Any]] = {
+        "type": "object",
+        "properties": {
+            "city": {
+                "type": "string",
+                "description": "City name to get weather for"
+            },
+            "weather_type": {
+                "type": "string",
+                "description": "Optional weather type (current, forecast, etc.)",
+                "default": "current"
+            }
+        },
+        "required": ["city"]
+    }
+    
     def __init__(self):
         super().__init__(
             name="get_weather",
@@ -23,21 +40,7 @@ class WeatherTool(BaseTool):
     @property
     def parameters(self) -> Dict[str, Any]:
         """JSON schema for weather tool parameters"""
-        return {
-            "type": "object",
-            "properties": {
-                "city": {
-                    "type": "string",
-                    "description": "City name to get weather for"
-                },
-                "weather_type": {
-                    "type": "string",
-                    "description": "Optional weather type (current, forecast, etc.)",
-                    "default": "current"
-                }
-            },
-            "required": ["city"]
-        }
+        return self._PARAMETERS
     
     async def execute(self, city: str, weather_type: Optional[str] = None) -> str:
         """
@@ -50,16 +53,18 @@ class WeatherTool(BaseTool):
         Returns:
             Weather information as a string
         """
-        logger.info("Getting weather information", city=city, weather_type=weather_type)
+        if info_enabled(__name__):
+            logger.info("Getting weather information", city=city, weather_type=weather_type)
         
         # Use real weather API service
         result = await weather_api_service.get_current_weather(city)
         
-        logger.info("Weather information retrieved", city=city, result=result[:50])
+        if info_enabled(__name__):
+            logger.info("Weather information retrieved", city=city, result=result[:50])
         return result
     
-    def get_function_tool(self):
-        """Return the function_tool decorated version."""
+    def _build_function_tool(self):
+        """Build the function_tool decorated version."""
         
         @function_tool
         def get_weather(city: str, weather_type: Optional[str] = None) -> str:
@@ -73,12 +78,14 @@ class WeatherTool(BaseTool):
             Returns:
                 Weather information as a string
             """            
-            logger.info("Getting weather information via function tool", city=city, weather_type=weather_type)
+            if info_enabled(__name__):
+                logger.info("Getting weather information via function tool", city=city, weather_type=weather_type)
             
             # Use synchronous weather API service for function tools
             try:
                 result = weather_api_service.get_current_weather_sync(city)
-                logger.info("Weather information retrieved via function tool", city=city, result=result[:50])
+                if info_enabled(__name__):
+                    logger.info("Weather information retrieved via function tool", city=city, result=result[:50])
                 return result
                 
             except Exception as e:
@@ -90,5 +97,78 @@ class WeatherTool(BaseTool):
         return get_weather
 
 
-# Create a global instance for easy import
-weather_tool = WeatherTool()
\ No newline at end of file
+class WeatherBatchTool(BaseTool):
+    """Tool for getting weather information for several cities in one call."""
+    
+    # Static JSON schema returned by `parameters`
+    _PARAMETERS: ClassVar[Dict[str, Any]] = {
+        "type": "object",
+        "properties": {
+            "cities": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "City names to get weather for"
+            }
+        },
+        "required": ["cities"]
+    }
+    
+    def __init__(self):
+        super().__init__(
+            name="get_weather_batch",
+            description="Get current weather information for several cities at once"
+        )
+    
+    @property
+    def parameters(self) -> Dict[str, Any]:
+        """JSON schema for batch weather tool parameters"""
+        return self._PARAMETERS
+    
+    async def execute(self, cities: List[str]) -> str:
+        """
+        Get weather information for several cities concurrently.
+        
+        Args:
+            cities: The city names to get weather for
+            
+        Returns:
+            Weather information for each city, one per line
+        """
+        if info_enabled(__name__):
+            logger.info("Getting weather information for cities", cities=cities)
+        
+        results = await weather_api_service.get_current_weather_batch(cities)
+        return "\n".join(results)
+    
+    def _build_function_tool(self):
+        """Build the function_tool decorated version."""
+        
+        @function_tool
+        async def get_weather_batch(cities: List[str]) -> str:
+            """
+            Get weather information for several cities at once.
+            
+            Args:
+                cities: The city names to get weather for
+            
+            Returns:
+                Weather information for each city, one per line
+            """
+            if info_enabled(__name__):
+                logger.info("Getting weather information for cities via function tool", cities=cities)
+            
+            # The lookups run concurrently on the pooled async client
+            try:
+                results = await weather_api_service.get_current_weather_batch(cities)
+                return "\n".join(results)
+                
+            except Exception as e:
+                logger.error("Error getting weather for cities via function tool", error=str(e), cities=cities)
+                return "Weather API temporarily unavailable. Please try again later."
+        
+        return get_weather_batch
+
+
+# Create global instances for easy import
+weather_tool = WeatherTool()
+weather_batch_tool = WeatherBatchTool()
\ No newline at end of file
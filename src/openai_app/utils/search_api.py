@@ -1,13 +1,19 @@
 """
 Search API service using Tavily for web search capabilities.
 """
-from typing import List, Dict, Any, Optional
+import asyncio
+from functools import partial
+from typing import List, Dict, Any, Optional, Tuple
 from tavily import TavilyClient
+from .cache import TTLCache
 from ..config.settings import settings
-from ..config.logging import get_logger
+from ..config.logging import get_logger, info_enabled
 
 logger = get_logger(__name__)
 
+# Upper bound on cached searches; the least recently used are evicted first
+_CACHE_MAX_ENTRIES = 256
+
 
 class SearchAPIService:
     """Service for performing web searches using Tavily."""
@@ -18,6 +24,8 @@ class SearchAPIService:
         self.max_results = settings.tavily_max_results
         self.include_answer = settings.tavily_include_answer
         self.include_raw_content = settings.tavily_include_raw_content
+        self._cache: TTLCache[Tuple[str, int], str] = TTLCache(_CACHE_MAX_ENTRIES, settings.search_cache_ttl)
+        self._inflight: Dict[Tuple[str, int], asyncio.Future] = {}
         
         # Create client if API key is available
         if self.api_key:
@@ -37,7 +45,31 @@ class SearchAPIService:
         Returns:
             Formatted search results as string
         """
-        return self.search_web_sync(query, max_results)
+        # Identical searches already in flight share one upstream call. The
+        # map is only touched from the event loop, so it needs no lock.
+        key = self._cache_key(query, max_results)
+        task = self._inflight.get(key)
+        if task is None:
+            # The Tavily client is blocking; run it off the event loop
+            task = asyncio.ensure_future(asyncio.to_thread(self.search_web_sync, query, max_results))
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._forget_inflight, key))
+        
+        # Shield the shared search so one caller's cancellation leaves the others waiting
+        return await asyncio.shield(task)
+    
+    async def search_web_batch(self, queries: List[str], max_results: Optional[int] = None) -> List[str]:
+        """
+        Perform several web searches concurrently.
+        
+        Args:
+            queries: Search query strings
+            max_results: Optional override for max results
+            
+        Returns:
+            Formatted search results, in the same order as the queries
+        """
+        return await asyncio.gather(*(self.search_web(query, max_results) for query in queries))
     
     def search_web_sync(self, query: str, max_results: Optional[int] = None) -> str:
         """
@@ -53,11 +85,17 @@ class SearchAPIService:
         if not self.client:
             return "Search API not configured. Please add TAVILY_API_KEY to your environment."
         
+        # Use provided max_results or fall back to configured default
+        num_results = max_results if max_results is not None else self.max_results
+        
+        key = self._cache_key(query, num_results)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        
         try:
-            # Use provided max_results or fall back to configured default
-            num_results = max_results if max_results is not None else self.max_results
-            
-            logger.info("Performing web search", query=query, max_results=num_results)
+            if info_enabled(__name__):
+                logger.info("Performing web search", query=query, max_results=num_results)
             
             # Perform search using Tavily
             response = self.client.search(
@@ -69,7 +107,9 @@ class SearchAPIService:
             
             # Format and return results
             formatted_results = self._format_search_results(response, query)
-            logger.info("Search completed", query=query, results_count=len(response.get('results', [])))
+            if info_enabled(__name__):
+                logger.info("Search completed", query=query, results_count=len(response.get('results', [])))
+            self._cache.set(key, formatted_results)
             
             return formatted_results
             
@@ -77,6 +117,20 @@ class SearchAPIService:
             logger.error("Search API error", error=str(e), query=query)
             return f"Unable to perform search for '{query}' at the moment. Error: {str(e)}"
     
+    def _forget_inflight(self, key: Tuple[str, int], task: asyncio.Future) -> None:
+        """Drop a finished search from the in-flight map unless a newer one replaced it."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+    
+    def _cache_key(self, query: str, max_results: Optional[int]) -> Tuple[str, int]:
+        num_results = max_results if max_results is not None else self.max_results
+        # Keyed on the exact query, since the formatted results echo it back
+        return (query, num_results)
+    
+    def clear_cache(self) -> None:
+        """Drop all cached search results."""
+        self._cache.clear()
+    
     def _format_search_results(self, response: Dict[str, Any], query: str) -> str:
         """Format search results into a readable string."""
         if not response or 'results' not in response:
@@ -86,12 +140,12 @@ class SearchAPIService:
         if not results:
             return f"No search results found for '{query}'."
         
-        # Start building formatted response
-        formatted = f"Search results for '{query}':\n\n"
+        # Collect the pieces and join once at the end
+        parts: List[str] = [f"Search results for '{query}':\n\n"]
         
         # Add AI-generated answer if available
-        if self.include_answer and 'answer' in response and response['answer']:
-            formatted += f"**Quick Answer:** {response['answer']}\n\n"
+        if self.include_answer and response.get('answer'):
+            parts.append(f"**Quick Answer:** {response['answer']}\n\n")
         
         # Add individual search results
         for i, result in enumerate(results, 1):
@@ -101,13 +155,11 @@ class SearchAPIService:
             
             # Truncate content if it's too long
             if len(content) > 200:
-                content = content[:200] + "..."
+                content = f"{content[:200]}..."
             
-            formatted += f"{i}. **{title}**\n"
-            formatted += f"   URL: {url}\n"
-            formatted += f"   Summary: {content}\n\n"
+            parts.append(f"{i}. **{title}**\n   URL: {url}\n   Summary: {content}\n\n")
         
-        return formatted.strip()
+        return "".join(parts).strip()
 
 
 # Global instance
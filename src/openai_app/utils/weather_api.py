@@ -1,13 +1,21 @@
 """
 Weather API service for fetching real weather data.
 """
+import asyncio
+import threading
+import weakref
 import httpx
-from typing import Optional, Dict, Any
+import orjson
+from typing import Optional, Dict, Any, List
+from .cache import TTLCache
 from ..config.settings import settings
-from ..config.logging import get_logger
+from ..config.logging import get_logger, info_enabled
 
 logger = get_logger(__name__)
 
+# Upper bound on cached cities; the least recently used are evicted first
+_CACHE_MAX_ENTRIES = 1000
+
 
 class WeatherAPIService:
     """Service for fetching real weather data from OpenWeatherMap API."""
@@ -16,14 +24,44 @@ class WeatherAPIService:
         self.api_key = settings.weather_api_key
         self.base_url = settings.weather_api_base_url
         self._client = None
+        self._sync_client: Optional[httpx.Client] = None
+        # Cached values are the city-independent weather details, so a hit
+        # still echoes each caller's own spelling of the city
+        self._cache: TTLCache[str, str] = TTLCache(_CACHE_MAX_ENTRIES, settings.weather_cache_ttl)
+        self._lock = threading.Lock()
+        # Single-flight locks disappear once no caller holds them
+        self._async_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+        self._sync_locks: "weakref.WeakValueDictionary[str, threading.Lock]" = weakref.WeakValueDictionary()
     
     @property
     def client(self):
         """Get or create HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=10.0)
+        # A closed client is detected when a request fails, not on every access
+        return self._client or self._build_client()
+    
+    def _build_client(self) -> httpx.AsyncClient:
+        # HTTP/2 multiplexes concurrent lookups over one connection
+        self._client = httpx.AsyncClient(
+            timeout=10.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+        )
         return self._client
     
+    @property
+    def sync_client(self) -> httpx.Client:
+        """Get or create the pooled synchronous HTTP client."""
+        client = self._sync_client
+        if client is None or client.is_closed:
+            with self._lock:
+                client = self._sync_client
+                if client is None or client.is_closed:
+                    client = self._sync_client = httpx.Client(
+                        timeout=10.0,
+                        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+                    )
+        return client
+    
     async def get_current_weather(self, city: str) -> str:
         """
         Get current weather for a city.
@@ -38,6 +76,19 @@ class WeatherAPIService:
             logger.warning("Weather API key not configured, using simulation")
             return f"Weather API not configured. Simulated: The weather in {city} is sunny with 25°C."
         
+        key = self._cache_key(city)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return self._format_weather_response(cached, city)
+        
+        # Only one request per city is in flight; concurrent callers wait for it
+        async with self._async_lock_for(key):
+            cached = self._cache.get(key)
+            if cached is not None:
+                return self._format_weather_response(cached, city)
+            return await self._fetch_current_weather(city, key)
+    
+    async def _fetch_current_weather(self, city: str, key: str) -> str:
         try:
             url = f"{self.base_url}/weather"
             params = {
@@ -46,12 +97,20 @@ class WeatherAPIService:
                 "units": "metric"  # Celsius
             }
             
-            logger.info("Fetching weather data", city=city)
-            response = await self.client.get(url, params=params)
+            if info_enabled(__name__):
+                logger.info("Fetching weather data", city=city)
+            try:
+                response = await self.client.get(url, params=params)
+            except RuntimeError:
+                # The client was closed (or its event loop ended); rebuild it and retry once
+                self._client = None
+                response = await self.client.get(url, params=params)
             response.raise_for_status()
             
-            data = response.json()
-            return self._format_weather_response(data, city)
+            details = self._parse_weather_details(orjson.loads(response.content))
+            if details is not None:
+                self._cache.set(key, details)
+            return self._format_weather_response(details, city)
             
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -64,20 +123,36 @@ class WeatherAPIService:
             logger.error("Weather API error", error=str(e), city=city)
             return f"Unable to fetch weather for {city} at the moment."
     
-    def _format_weather_response(self, data: Dict[str, Any], city: str) -> str:
-        """Format the API response into a readable string."""
+    async def get_current_weather_batch(self, cities: List[str]) -> List[str]:
+        """
+        Get current weather for several cities concurrently.
+        
+        Args:
+            cities: City names
+            
+        Returns:
+            Formatted weather descriptions, in the same order as the cities
+        """
+        return await asyncio.gather(*(self.get_current_weather(city) for city in cities))
+    
+    def _format_weather_response(self, details: Optional[str], city: str) -> str:
+        """Format parsed weather details for a city into a readable string."""
+        if details is None:
+            return f"Received weather data for {city} but couldn't parse it properly."
+        return f"The weather in {city} is {details}."
+    
+    def _parse_weather_details(self, data: Dict[str, Any]) -> Optional[str]:
+        """Describe the API response without the city name, or None if it can't be parsed."""
         try:
-            weather = data["weather"][0]
             main = data["main"]
-            wind = data.get("wind", {})
             
-            description = weather["description"].title()
+            description = data["weather"][0]["description"].lower()
             temp = round(main["temp"])
             feels_like = round(main["feels_like"])
             humidity = main["humidity"]
-            wind_speed = wind.get("speed", 0)
+            wind_speed = data.get("wind", {}).get("speed", 0)
             
-            response = f"The weather in {city} is {description.lower()} with a temperature of {temp}°C"
+            response = f"{description} with a temperature of {temp}°C"
             
             if feels_like != temp:
                 response += f" (feels like {feels_like}°C)"
@@ -87,13 +162,11 @@ class WeatherAPIService:
             if wind_speed > 0:
                 response += f", and wind speed {wind_speed} m/s"
             
-            response += "."
-            
             return response
             
         except KeyError as e:
             logger.error("Error parsing weather data", error=str(e))
-            return f"Received weather data for {city} but couldn't parse it properly."
+            return None
     
     def get_current_weather_sync(self, city: str) -> str:
         """
@@ -109,6 +182,19 @@ class WeatherAPIService:
             logger.warning("Weather API key not configured, using simulation")
             return f"Weather API not configured. Simulated: The weather in {city} is sunny with 25°C."
         
+        key = self._cache_key(city)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return self._format_weather_response(cached, city)
+        
+        # Only one request per city is in flight; concurrent callers wait for it
+        with self._sync_lock_for(key):
+            cached = self._cache.get(key)
+            if cached is not None:
+                return self._format_weather_response(cached, city)
+            return self._fetch_current_weather_sync(city, key)
+    
+    def _fetch_current_weather_sync(self, city: str, key: str) -> str:
         try:
             url = f"{self.base_url}/weather"
             params = {
@@ -117,15 +203,17 @@ class WeatherAPIService:
                 "units": "metric"  # Celsius
             }
             
-            logger.info("Fetching weather data synchronously", city=city)
+            if info_enabled(__name__):
+                logger.info("Fetching weather data synchronously", city=city)
             
-            # Use synchronous httpx client for function tools
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(url, params=params)
-                response.raise_for_status()
-                
-                data = response.json()
-                return self._format_weather_response(data, city)
+            # Use the pooled synchronous client for function tools
+            response = self.sync_client.get(url, params=params)
+            response.raise_for_status()
+            
+            details = self._parse_weather_details(orjson.loads(response.content))
+            if details is not None:
+                self._cache.set(key, details)
+            return self._format_weather_response(details, city)
                 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -138,11 +226,39 @@ class WeatherAPIService:
             logger.error("Weather API error", error=str(e), city=city)
             return f"Unable to fetch weather for {city} at the moment."
     
+    @staticmethod
+    def _cache_key(city: str) -> str:
+        return city.strip().lower()
+    
+    def _async_lock_for(self, key: str) -> asyncio.Lock:
+        with self._lock:
+            lock = self._async_locks.get(key)
+            if lock is None:
+                lock = self._async_locks[key] = asyncio.Lock()
+            return lock
+    
+    def _sync_lock_for(self, key: str) -> threading.Lock:
+        with self._lock:
+            lock = self._sync_locks.get(key)
+            if lock is None:
+                lock = self._sync_locks[key] = threading.Lock()
+            return lock
+    
+    def clear_cache(self) -> None:
+        """Drop all cached weather responses."""
+        self._cache.clear()
+    
     async def close(self):
         """Close the HTTP client."""
         if self._client and not self._client.is_closed:
             await self._client.aclose()
             self._client = None
+    
+    def close_sync(self):
+        """Close the synchronous HTTP client."""
+        if self._sync_client and not self._sync_client.is_closed:
+            self._sync_client.close()
+            self._sync_client = None
 
 
 # Global instance
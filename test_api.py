@@ -8,10 +8,13 @@ import json
 
 BASE_URL = "http://localhost:8000"
 
+# One session for every request so the keep-alive connection is reused
+SESSION = requests.Session()
+
 def test_health():
     """Test health endpoint"""
     print("🔍 Testing Health Endpoint...")
-    response = requests.get(f"{BASE_URL}/api/health")
+    response = SESSION.get(f"{BASE_URL}/api/health")
     print(f"Status: {response.status_code}")
     print(f"Response: {json.dumps(response.json(), indent=2)}")
     print()
@@ -19,7 +22,7 @@ def test_health():
 def test_tools():
     """Test tools endpoint"""
     print("🛠️ Testing Tools Endpoint...")
-    response = requests.get(f"{BASE_URL}/api/tools/available")
+    response = SESSION.get(f"{BASE_URL}/api/tools/available")
     print(f"Status: {response.status_code}")
     data = response.json()
     print(f"Found {data['total_count']} tools:")
@@ -33,7 +36,7 @@ def test_tool_execution():
     
     # Test calculator
     print("Testing Calculator:")
-    response = requests.post(
+    response = SESSION.post(
         f"{BASE_URL}/api/tools/execute",
         json={
             "tool_name": "calculate",
@@ -48,7 +51,7 @@ def test_tool_execution():
 def test_chat():
     """Test chat endpoint"""
     print("💬 Testing Chat Endpoint...")
-    response = requests.post(
+    response = SESSION.post(
         f"{BASE_URL}/api/chat/message",
         json={
             "message": "Calculate 15 * 3 for me",
@@ -82,3 +85,5 @@ if __name__ == "__main__":
         print("❌ Could not connect to the server. Make sure it's running on http://localhost:8000")
     except Exception as e:
         print(f"❌ Error during testing: {e}")
+    finally:
+        SESSION.close()
@@ -5,6 +5,8 @@ Test script to verify calculator tool functionality.
 import ast
 import operator
 import math
+from collections import OrderedDict
+from types import CodeType
 
 
 class SafeMathEvaluator:
@@ -43,51 +45,69 @@ class SafeMathEvaluator:
         'e': math.e,
     }
     
+    # Compiled expressions kept for reuse
+    cache_size = 256
+    
+    def __init__(self):
+        # Namespace compiled expressions run in; only the whitelisted names exist
+        self._globals = {"__builtins__": {}, **self.functions}
+        self._cache: "OrderedDict[str, CodeType]" = OrderedDict()
+    
     def evaluate(self, expression: str) -> float:
         """Safely evaluate a mathematical expression."""
         try:
-            # Parse the expression
-            node = ast.parse(expression.strip(), mode='eval')
-            return self._eval(node.body)
+            code = self._cache.get(expression)
+            if code is None:
+                code = self._compile(expression)
+            else:
+                self._cache.move_to_end(expression)
+            return eval(code, self._globals, {})
         except Exception as e:
             raise ValueError(f"Invalid expression: {str(e)}")
     
-    def _eval(self, node: ast.AST):
-        """Recursively evaluate AST nodes."""
-        if isinstance(node, ast.Constant):  # Python 3.8+
-            return node.value
-        elif isinstance(node, ast.Num):  # Python < 3.8 compatibility
-            return node.n
-        elif isinstance(node, ast.Name):
-            if node.id in self.functions:
-                return self.functions[node.id]
-            else:
-                raise ValueError(f"Unknown variable: {node.id}")
-        elif isinstance(node, ast.BinOp):
-            left = self._eval(node.left)
-            right = self._eval(node.right)
-            op = self.operators.get(type(node.op))
-            if op is None:
-                raise ValueError(f"Unsupported operator: {type(node.op).__name__}")
-            return op(left, right)
-        elif isinstance(node, ast.UnaryOp):
-            operand = self._eval(node.operand)
-            op = self.operators.get(type(node.op))
-            if op is None:
-                raise ValueError(f"Unsupported unary operator: {type(node.op).__name__}")
-            return op(operand)
-        elif isinstance(node, ast.Call):
-            func = self._eval(node.func)
-            if not callable(func):
-                raise ValueError(f"Not a function: {func}")
-            args = [self._eval(arg) for arg in node.args]
-            return func(*args)
-        elif isinstance(node, ast.List):
-            return [self._eval(item) for item in node.elts]
-        elif isinstance(node, ast.Tuple):
-            return tuple(self._eval(item) for item in node.elts)
-        else:
+    def _compile(self, expression: str) -> CodeType:
+        """Parse and validate an expression, then compile and cache it."""
+        tree = ast.parse(expression.strip(), mode='eval')
+        _validate(tree, self.functions)
+        code = compile(tree, '<calc>', 'eval')
+        self._cache[expression] = code
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return code
+
+
+def _allow(node: ast.AST, names):
+    """Accept a node that needs no further checks."""
+
+
+def _check_name(node: ast.Name, names):
+    """Only allow names of the whitelisted functions and constants."""
+    if node.id not in names:
+        raise ValueError(f"Unknown variable: {node.id}")
+
+
+# Validator for each node type an expression may contain; anything else is rejected
+_NODE_VALIDATORS = {
+    ast.Expression: _allow,
+    ast.Constant: _allow,
+    ast.Name: _check_name,
+    ast.BinOp: _allow,
+    ast.UnaryOp: _allow,
+    ast.Call: _allow,
+    ast.List: _allow,
+    ast.Tuple: _allow,
+    ast.Load: _allow,
+    **{op: _allow for op in SafeMathEvaluator.operators},
+}
+
+
+def _validate(tree: ast.AST, names):
+    """Check every node of a parsed expression against the whitelist."""
+    for node in ast.walk(tree):
+        validate = _NODE_VALIDATORS.get(type(node))
+        if validate is None:
             raise ValueError(f"Unsupported node type: {type(node).__name__}")
+        validate(node, names)
 
 
 def test_calculator():